@@ -0,0 +1,86 @@
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+from src.paradex.registry import CHAIN_ID
+from utils.signing import SigningEngine
+from utils.stark import build_trade_message
+
+MARKET = "ETH-USD-PERP"
+
+
+def make_accounts(n: int):
+    client = FullNodeClient(node_url="http://127.0.0.1:1")
+    return [
+        Account(
+            client=client,
+            address=0x49D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7 + i,
+            key_pair=KeyPair.from_private_key(0x1234567890ABCDEF + i),
+            chain=CHAIN_ID,
+        )
+        for i in range(n)
+    ]
+
+
+def bench_typed_data(accounts, orders):
+    for i, account in enumerate(accounts * orders):
+        message = build_trade_message(MARKET, "MARKET", "BUY", Decimal("0.125"), 1700000000000 + i)
+        account.sign_message(message)
+
+
+def bench_engine(engine, accounts, orders):
+    for i, account in enumerate(accounts * orders):
+        engine.sign_order(account, MARKET, "MARKET", "BUY", Decimal("0.125"), 1700000000000 + i)
+
+
+def bench_pool(engine, accounts, orders):
+    items = [
+        (account.signer.private_key,
+         engine.order_hash(account.address, MARKET, "MARKET", "BUY", Decimal("0.125"), 1700000000000 + i))
+        for i, account in enumerate(accounts * orders)
+    ]
+    engine.sign_many(items)
+
+
+def run(name, func, total, *args):
+    started = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<28} {total:>6} signatures  {elapsed:8.3f} s  {total / elapsed:10.1f} sig/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Order signing throughput")
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=10, help="Orders per account")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    accounts = make_accounts(args.accounts)
+    total = args.accounts * args.orders
+
+    engine = SigningEngine()
+    pool = SigningEngine(processes=args.processes)
+    pool.sign_many([(1, 1)] * args.processes)
+
+    sample = accounts[0]
+    legacy = sample.sign_message(build_trade_message(MARKET, "MARKET", "SELL", Decimal("2"), 1700000000000))
+    signed = engine.sign_order(sample, MARKET, "MARKET", "SELL", Decimal("2"), 1700000000000)
+    assert list(legacy) == list(signed), "engine signing diverges from TypedData signing"
+
+    run("account.sign_message", bench_typed_data, total, accounts, args.orders)
+    run("signing engine", bench_engine, total, engine, accounts, args.orders)
+    run(f"signing engine, {args.processes} processes", bench_pool, total, pool, accounts, args.orders)
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_PRICES = ["ETH-USD-PERP=2500", "BTC-USD-PERP=60000"]
+
+
+def write_data_dir(data_dir: str, args) -> None:
+    with open(os.path.join(ROOT, "data", "config.json"), encoding="utf-8") as file:
+        config = json.load(file)
+
+    config["market_data"]["source"] = "rest"
+    config["workers"]["processes"] = 0
+    config["sessions"]["count"] = 1
+    config["signing"]["processes"] = 0
+    config["accounts_per_trade"] = {"min": args.legs, "max": args.legs}
+    config["order_duration_min"] = {"min": args.duration_min, "max": args.duration_min}
+    with open(os.path.join(data_dir, "config.json"), "w", encoding="utf-8") as file:
+        json.dump(config, file, indent=2)
+
+    pd.DataFrame([
+        {
+            "private_key": hex(random.getrandbits(240)),
+            "address": hex(random.getrandbits(250)),
+            "proxy": "",
+            "is_active": True,
+        }
+        for _ in range(args.accounts)
+    ]).to_excel(os.path.join(data_dir, "accounts.xlsx"), index=False)
+
+    symbols = [item.split("=")[0] for item in args.price]
+    pd.DataFrame({"symbol": symbols}).to_excel(os.path.join(data_dir, "active_pairs.xlsx"), index=False)
+
+
+def start_stub(args) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "src.paradex.rest_stub", "--port", str(args.port),
+        "--volatility", str(args.volatility), "--drift", str(args.drift), "--error-rate", str(args.error_rate),
+        "--lost-ack-rate", str(args.lost_ack_rate),
+    ]
+    for item in args.price:
+        command += ["--price", item]
+    stub = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL)
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{args.port}/v1/markets", timeout=1)
+            return stub
+        except OSError:
+            time.sleep(0.1)
+    stub.terminate()
+    raise RuntimeError("REST stub did not start")
+
+
+def run(args) -> int:
+    # Everything below reads config and paths at import time, so it is only
+    # imported once the environment points at the scratch data dir and stub.
+    from src.accounts_monitor import BackgroundRefresher, refresh_dirty_accounts, update_accounts_info
+    from src.config.paths import ACCOUNTS_PATH
+    from src.paradex.account import get_open_positions
+    from src.paradex.market import update_markets
+    from src.paradex.registry import get_registry
+    from src.position_manager import LtvBreach, TradingManager
+    from utils.account_store import get_account_exporter, get_account_store
+    from utils.clock import SimulatedClock, set_clock
+    from utils.general import _retry_request
+
+    clock = SimulatedClock()
+    set_clock(clock)
+
+    get_account_store().import_xlsx(ACCOUNTS_PATH)
+    update_markets()
+    update_accounts_info()
+
+    registry = get_registry()
+    manager = TradingManager(clock=clock)
+    refresh_config = manager.config["accounts_refresh"]
+    refresher = BackgroundRefresher(
+        refresh_config["background_interval_sec"], refresh_config["background_batch_size"], clock
+    )
+
+    started_real, started_virtual = time.time(), clock.time()
+    cycles = 0
+    refresher.start()
+    try:
+        for _ in range(args.cycles):
+            plan = manager.plan_cycle()
+            if plan is None:
+                break
+            manager.execute_plan(plan)
+            try:
+                manager.monitor_ltv(plan.order_duration)
+            except LtvBreach as e:
+                print(f"Cycle {cycles + 1} stopped by the LTV monitor: {e}")
+                break
+            manager.close_all_positions()
+            refresh_dirty_accounts()
+            cycles += 1
+    finally:
+        refresher.stop()
+
+    left_open = [
+        account_id for account_id in registry.ids(active_only=False)
+        if any(position.is_open for position in _retry_request(get_open_positions, registry.get(account_id), None))
+    ]
+    # Write accounts.xlsx now; the exit-time export would find the data dir gone.
+    get_account_exporter().flush()
+
+    print(
+        f"Cycles: {cycles} | Simulated: {round((clock.time() - started_virtual) / 60, 1)} min | "
+        f"Real: {round(time.time() - started_real, 1)} sec | Accounts left open: {len(left_open)}"
+    )
+    return 1 if left_open else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run trading cycles against the REST stub in simulated time")
+    parser.add_argument("--accounts", type=int, default=8)
+    parser.add_argument("--legs", type=int, default=4, help="Accounts per trade")
+    parser.add_argument("--cycles", type=int, default=2)
+    parser.add_argument("--duration-min", type=int, default=60, help="Simulated hold per cycle")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--volatility", type=float, default=0.001)
+    parser.add_argument("--drift", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--lost-ack-rate", type=float, default=0.0, help="Orders accepted but answered with 503")
+    parser.add_argument("--price", action="append", default=[], help="Initial price, e.g. ETH-USD-PERP=2500")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch data dir")
+    args = parser.parse_args()
+    args.price = args.price or DEFAULT_PRICES
+
+    data_dir = tempfile.mkdtemp(prefix="paradex-sim-")
+    write_data_dir(data_dir, args)
+    os.environ["PARADEX_DATA_DIR"] = data_dir
+    os.environ["PARADEX_HTTP_URL"] = f"http://127.0.0.1:{args.port}/v1"
+
+    stub = start_stub(args)
+    try:
+        code = run(args)
+    finally:
+        stub.terminate()
+        if args.keep:
+            print(f"Data dir: {data_dir}")
+        else:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 from src.accounts_monitor import update_accounts_info
 from src.paradex_pair_metrics import update_metrics
-from src.position_manager import TradingManager
+from src.config.constants import logger
+from src.position_manager import LtvBreach, TradingManager
+from src.session_scheduler import SessionScheduler
+from src.config.paths import ACCOUNTS_PATH
+from src.paradex.client import close_sessions
+from utils.account_store import get_account_store
+from utils.data import USER_CONFIG
 from utils.initial_checks import start as start_initial_checks
 
 import questionary
@@ -12,26 +18,38 @@ if __name__ == "__main__":
         choices=[
             "1. ⚙️  Start trading",
             "2. 📊 Fetch market data and update active trading pairs (data/active_pairs.xlsx)",
-            "3. 🔄 Update account balances and check for open positions (data/accounts.xlsx)",
+            "3. 🔄 Update account balances and check for open positions (account store, exported to data/accounts.xlsx)",
             "4. 🛑 Close all currently open positions",
-            "5. ❌ Exit"
+            "5. 📥 Import accounts from data/accounts.xlsx",
+            "6. ❌ Exit"
         ]
     ).ask()
 
-    if action.startswith("1"):
-        start_initial_checks()
-        manager = TradingManager()
-        manager.start_trading()
-
-    elif action.startswith("2"):
-        update_metrics()
-
-    elif action.startswith("3"):
-        update_accounts_info()
-
-    elif action.startswith("4"):
-        manager = TradingManager()
-        manager.close_all_positions()
-
-    else:
-        print("Exited.")
+    try:
+        if action.startswith("1"):
+            start_initial_checks()
+            if USER_CONFIG["sessions"]["count"] > 1:
+                SessionScheduler.from_config().run()
+            else:
+                manager = TradingManager()
+                manager.start_trading()
+
+        elif action.startswith("2"):
+            update_metrics()
+
+        elif action.startswith("3"):
+            update_accounts_info()
+
+        elif action.startswith("4"):
+            manager = TradingManager()
+            manager.close_all_positions()
+
+        elif action.startswith("5"):
+            get_account_store().import_xlsx(ACCOUNTS_PATH)
+
+        else:
+            print("Exited.")
+    except LtvBreach as e:
+        logger.error(f"Trading stopped: {e}. Positions were closed.")
+    finally:
+        close_sessions()
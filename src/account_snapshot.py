@@ -0,0 +1,158 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.paradex.models import Position
+from utils.account_store import ACCOUNT_COLUMNS, BASE_TOKEN, IDENTITY_COLUMNS, POSITION_COLUMNS
+from utils.stark import hex_to_int
+
+FLOAT_COLUMNS = [name for name, kind in POSITION_COLUMNS if kind == "REAL"]
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return float(value)
+
+
+@dataclass(slots=True)
+class PositionRecord:
+    market: str
+    side: str
+    size: float
+    avg_price: float
+    mark_price: float
+    liq_price: float
+    pnl: float
+    ltv: Optional[float]
+
+    @classmethod
+    def from_position(cls, position: Position) -> "PositionRecord":
+        return cls(
+            market=position.market,
+            side=position.side,
+            size=float(position.abs_size),
+            avg_price=float(position.average_entry_price),
+            mark_price=float(position.mark_price),
+            liq_price=float(position.liquidation_price),
+            pnl=float(position.unrealized_pnl),
+            ltv=position.ltv,
+        )
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> Optional["PositionRecord"]:
+        market = row.get("position_market")
+        if not isinstance(market, str) or not market:
+            return None
+        return cls(
+            market=market,
+            side=str(row.get("position_side") or ""),
+            size=_optional_float(row.get("position_size")) or 0.0,
+            avg_price=_optional_float(row.get("position_avg_price")) or 0.0,
+            mark_price=_optional_float(row.get("position_mark_price")) or 0.0,
+            liq_price=_optional_float(row.get("position_liq_price")) or 0.0,
+            pnl=_optional_float(row.get("position_pnl")) or 0.0,
+            ltv=_optional_float(row.get("position_ltv")),
+        )
+
+
+@dataclass(slots=True)
+class AccountRecord:
+    private_key: str
+    address: str
+    proxy: Optional[str]
+    is_active: bool
+    balances: Dict[str, float] = field(default_factory=dict)
+    position: Optional[PositionRecord] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "AccountRecord":
+        proxy = row.get("proxy")
+        return cls(
+            private_key=str(row["private_key"]),
+            address=str(row["address"]),
+            proxy=proxy if isinstance(proxy, str) and proxy else None,
+            is_active=row.get("is_active") is True,
+            balances={
+                token: float(value) for token, value in row.items()
+                if token not in ACCOUNT_COLUMNS and _optional_float(value) is not None
+            },
+            position=PositionRecord.from_row(row),
+        )
+
+    @property
+    def account_id(self) -> str:
+        return hex(hex_to_int(self.private_key))
+
+    @property
+    def short_pk(self) -> str:
+        return self.private_key[:10]
+
+    def balance(self, token: str = BASE_TOKEN) -> float:
+        return self.balances.get(token, 0.0)
+
+
+class AccountSnapshot:
+    def __init__(self, records: Iterable[AccountRecord]) -> None:
+        self.records: List[AccountRecord] = list(records)
+        self._by_key = {record.private_key: record for record in self.records}
+        self._frame: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "AccountSnapshot":
+        return cls(AccountRecord.from_row(row) for row in df.to_dict("records"))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, private_key: str) -> Optional[AccountRecord]:
+        return self._by_key.get(private_key)
+
+    def select(self, account_ids: Iterable[str]) -> List[AccountRecord]:
+        wanted = set(account_ids)
+        return [record for record in self.records if record.account_id in wanted]
+
+    def active(self) -> List[AccountRecord]:
+        return [record for record in self.records if record.is_active]
+
+    def open_positions(self) -> List[AccountRecord]:
+        return [record for record in self.records if record.position is not None]
+
+    def tokens(self) -> List[str]:
+        tokens = {token for record in self.records for token in record.balances}
+        tokens.discard(BASE_TOKEN)
+        return [BASE_TOKEN] + sorted(tokens)
+
+    def to_frame(self) -> pd.DataFrame:
+        if self._frame is not None:
+            return self._frame
+
+        tokens = self.tokens()
+        columns: Dict[str, List[Any]] = {name: [] for name, _ in IDENTITY_COLUMNS}
+        columns.update({token: [] for token in tokens})
+        columns.update({name: [] for name, _ in POSITION_COLUMNS})
+
+        for record in self.records:
+            columns["private_key"].append(record.private_key)
+            columns["address"].append(record.address)
+            columns["proxy"].append(record.proxy)
+            columns["is_active"].append(record.is_active)
+            for token in tokens:
+                columns[token].append(record.balances.get(token))
+
+            position = record.position
+            columns["position_market"].append(position.market if position else "")
+            columns["position_side"].append(position.side if position else "")
+            columns["position_size"].append(position.size if position else None)
+            columns["position_avg_price"].append(position.avg_price if position else None)
+            columns["position_mark_price"].append(position.mark_price if position else None)
+            columns["position_liq_price"].append(position.liq_price if position else None)
+            columns["position_pnl"].append(position.pnl if position else None)
+            columns["position_ltv"].append(position.ltv if position else None)
+
+        self._frame = pd.DataFrame({
+            name: pd.Series(values, dtype="float64" if name in tokens or name in FLOAT_COLUMNS else object)
+            for name, values in columns.items()
+        })
+        return self._frame
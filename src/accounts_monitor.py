@@ -1,92 +1,144 @@
-import warnings
-import pandas as pd
-from decimal import Decimal
+import asyncio
+import threading
 import time
+import warnings
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional
 import random
 
+from src.account_snapshot import AccountRecord, AccountSnapshot, PositionRecord
 from src.config.constants import logger
-from src.config.paths import DATA_DIR
 from src.paradex.auth import get_account
-from src.paradex.account import get_balance, get_open_positions
-from utils.general import _retry_request
+from src.paradex.async_client import fetch_accounts
+from src.paradex.models import Balance, Position
+from src.shard_workers import get_coordinator
+from utils.account_store import get_account_exporter, get_account_store, load_accounts
+from utils.clock import Clock, get_clock
+from utils.data import USER_CONFIG, get_user_state
 
 warnings.filterwarnings("ignore")
 
 
-def update_accounts_info():
-    df = pd.read_excel(DATA_DIR + "/accounts.xlsx")
-
-    df = df.sample(frac=1).reset_index(drop=True)
-
-    for x in range(df.shape[0]):
-        data = df.iloc[x]
-
-        if not data["is_active"]:
-            continue
-
-        account = get_account(data["address"], data["private_key"])
-
-        balance_data = _retry_request(get_balance, account, data["proxy"])
-        for token_entry in balance_data.get("results", []):
-            token = token_entry["token"]
-            size = float(token_entry["size"])
-            df.loc[x, token] = size
-
-        position_data = _retry_request(get_open_positions, account, data["proxy"])
-        positions = position_data.get("results", [])
-
-        for pos in positions:
-            if pos["status"].upper() == "CLOSED":
-                continue
-
-            side = pos.get("side", "")
+_latest_snapshot: Optional[AccountSnapshot] = None
+_refreshed_at: Dict[str, float] = {}
+_snapshot_lock = threading.Lock()
+
+
+def update_accounts_info(account_ids: Optional[Iterable[str]] = None) -> AccountSnapshot:
+    return asyncio.run(update_accounts_info_async(account_ids))
+
+
+def refresh_dirty_accounts() -> AccountSnapshot:
+    dirty = get_account_store().dirty()
+    if not dirty:
+        return latest_snapshot()
+    logger.debug(f"Refreshing {len(dirty)} accounts touched by orders")
+    return update_accounts_info(dirty)
+
+
+def latest_snapshot() -> AccountSnapshot:
+    if _latest_snapshot is None:
+        return AccountSnapshot.from_frame(load_accounts())
+    return _latest_snapshot
+
+
+def _merge_snapshot(loaded: AccountSnapshot, refreshed: List[AccountRecord], started_at: float) -> AccountSnapshot:
+    # Refreshers run concurrently and finish out of order; keep the newest
+    # record per account instead of whichever run finished last.
+    global _latest_snapshot
+
+    with _snapshot_lock:
+        newest = {record.private_key: record for record in _latest_snapshot.records} if _latest_snapshot else {}
+        for record in refreshed:
+            if started_at >= _refreshed_at.get(record.private_key, 0.0):
+                _refreshed_at[record.private_key] = started_at
+                newest[record.private_key] = record
+
+        # Identity (proxy, is_active) comes from the store; only the refreshed
+        # state is carried over.
+        _latest_snapshot = AccountSnapshot(
+            replace(record, balances=newest[record.private_key].balances, position=newest[record.private_key].position)
+            if record.private_key in newest else record
+            for record in loaded.records
+        )
+        return _latest_snapshot
+
+
+async def update_accounts_info_async(account_ids: Optional[Iterable[str]] = None) -> AccountSnapshot:
+    store = get_account_store()
+    snapshot = AccountSnapshot.from_frame(load_accounts())
+    records = snapshot.active() if account_ids is None else snapshot.select(account_ids)
+    records = [record for record in records if record.is_active]
+    random.shuffle(records)
+
+    started_at = time.time()
+    coordinator = get_coordinator()
+    if coordinator is not None:
+        # Workers own the per-proxy rate limits and JWTs, so they do the reads.
+        states = await asyncio.to_thread(coordinator.refresh, [record.account_id for record in records])
+    else:
+        states = await fetch_accounts(
+            [(record.account_id, get_account(record.address, record.private_key), record.proxy) for record in records],
+            USER_CONFIG["accounts_refresh"],
+        )
+
+    for record in records:
+        _apply_state(record, *states[record.account_id])
+
+    if records:
+        store.upsert(AccountSnapshot(records).to_frame())
+        store.mark_refreshed([record.account_id for record in records], started_at)
+        get_account_exporter().schedule()
+
+    snapshot = _merge_snapshot(snapshot, records, started_at)
+    if account_ids is None:
+        logger.success(f"Updated balances and open positions for {len(records)} accounts.")
+    else:
+        logger.debug(f"Updated balances and open positions for {len(records)} of {len(snapshot)} accounts.")
+
+    return snapshot
+
+
+class BackgroundRefresher:
+    def __init__(self, interval_sec: float, batch_size: int, clock: Optional[Clock] = None) -> None:
+        self.interval_sec = interval_sec
+        self.batch_size = batch_size
+        self.clock = clock or get_clock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="accounts-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self.clock.wait(self._stop, self.interval_sec):
             try:
-                liq_price = float(pos.get("liquidation_price", 0))
-            except Exception:
-                liq_price = 0
-            unrealized_pnl = Decimal(pos.get("unrealized_pnl", "0"))
-            avg_price = Decimal(pos.get("average_entry_price", "0"))
-            size = abs(Decimal(pos.get("size", "0")))
-
-            if size > 0:
-                direction = -1 if side.upper() == "SHORT" else 1
-                mark_price = float((unrealized_pnl / (size * direction)) + avg_price)
-            else:
-                mark_price = 0.0
-
-            df.loc[x, "position_market"] = str(pos.get("market", ""))
-            df.loc[x, "position_side"] = str(side)
-            df.loc[x, "position_size"] = float(size)
-            df.loc[x, "position_avg_price"] = float(avg_price)
-            df.loc[x, "position_mark_price"] = mark_price
-            df.loc[x, "position_liq_price"] = liq_price
-            df.loc[x, "position_pnl"] = float(unrealized_pnl)
-
-            if liq_price > 0 and mark_price > 0:
-                if side.upper() == "SHORT":
-                    ltv = mark_price / liq_price
-                elif side.upper() == "LONG":
-                    ltv = liq_price / mark_price
-                else:
-                    ltv = None
-            else:
-                ltv = None
-
-            df.loc[x, "position_ltv"] = ltv
-            break
-        else:
-            df.loc[x, "position_market"] = ""
-            df.loc[x, "position_side"] = ""
-            df.loc[x, "position_size"] = None
-            df.loc[x, "position_avg_price"] = None
-            df.loc[x, "position_mark_price"] = None
-            df.loc[x, "position_liq_price"] = None
-            df.loc[x, "position_pnl"] = None
-            df.loc[x, "position_ltv"] = None
-
-        time.sleep(random.randint(3, 5))
-
-    df.to_excel(DATA_DIR + "/accounts.xlsx", index=False)
-    logger.success(f"Updated balances and open positions for {df.shape[0]} accounts.")
-
-    return df
+                self.refresh_stalest()
+            except Exception as e:
+                logger.warning(f"Background account refresh failed: {e}")
+
+    def refresh_stalest(self) -> None:
+        refreshed_at = get_account_store().refreshed_at()
+        state = get_user_state()
+        # Accounts holding positions first: the LTV monitor models their
+        # liquidation prices from these balances.
+        records = sorted(latest_snapshot().active(), key=lambda record: (
+            state.get(record.account_id, {}).get("position") != "active",
+            refreshed_at.get(record.account_id, 0.0),
+        ))
+        update_accounts_info([record.account_id for record in records[:self.batch_size]])
+
+
+def _apply_state(record: AccountRecord, balances: List[Balance], positions: List[Position]) -> None:
+    record.balances.update((balance.token, float(balance.size)) for balance in balances)
+    record.position = next(
+        (PositionRecord.from_position(position) for position in positions if position.is_open),
+        None,
+    )
@@ -1,7 +1,27 @@
+import os
+
 from src.config.configure_logger import get_logger
 
 logger = get_logger()
 
-PARADEX_HTTP_URL = "https://api.prod.paradex.trade/v1"
+PARADEX_HTTP_URL = os.environ.get("PARADEX_HTTP_URL") or "https://api.prod.paradex.trade/v1"
+PARADEX_WS_URL = "wss://ws.api.prod.paradex.trade/v1"
 STARKNET_FULLNODE_RPC_URL = "https://juno.api.prod.paradex.trade/rpc/v0_7"
 STARKNET_CHAIN_ID = "PRIVATE_SN_PARACLEAR_MAINNET"
+
+HTTP_CONNECT_TIMEOUT_SEC = 5
+HTTP_READ_TIMEOUT_SEC = 15
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+JWT_REFRESH_MARGIN_SEC = 60
+JWT_REFRESH_POLL_SEC = 5
+JWT_IDLE_SEC = 30 * 60
+JWT_FALLBACK_TTL_SEC = 5 * 60
+
+ORDER_FILL_TIMEOUT_SEC = 15
+ORDER_POLL_INITIAL_DELAY_SEC = 0.05
+ORDER_POLL_MAX_DELAY_SEC = 1.0
+ORDER_SETTLE_TIMEOUT_SEC = 30
+
+PRICE_SNAPSHOT_TTL_SEC = 5
@@ -0,0 +1,91 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from starknet_py.net.account.account import Account
+
+from src.config.constants import logger
+from src.paradex.models import Market
+from utils.clock import Clock, get_clock
+
+LegTemplate = Tuple[Account, Optional[str]]
+
+
+@dataclass(slots=True)
+class CyclePlan:
+    market: Market
+    account_ids: List[str]
+    templates: List[LegTemplate]
+    balances: Dict[str, float]
+    n_long: int
+    n_short: int
+    order_value: float
+    order_duration: int
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def symbol(self) -> str:
+        return self.market.symbol
+
+    @property
+    def token(self) -> str:
+        return self.market.base_currency
+
+
+class CyclePlanner:
+    def __init__(
+        self,
+        plan_func: Callable[[Iterable[str]], Optional[CyclePlan]],
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.plan_func = plan_func
+        self.clock = clock or get_clock()
+        self._plan: Optional[CyclePlan] = None
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+        self._cancel = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, exclude: Iterable[str], delay_sec: float) -> None:
+        exclude = list(exclude)
+        self._thread = threading.Thread(
+            target=self._run, args=(exclude, delay_sec), name="cycle-planner", daemon=True
+        )
+        self._thread.start()
+
+    def result(self, timeout: Optional[float] = None) -> Optional[CyclePlan]:
+        # Wake a planner still waiting for its start time and plan right away.
+        self._cancel.set()
+        if not self._done.wait(timeout):
+            raise TimeoutError("Next cycle plan is not ready")
+        if self._error is not None:
+            raise self._error
+        return self._plan
+
+    def cancel(self) -> Optional[CyclePlan]:
+        # Stops a planner that has not started planning yet; otherwise waits
+        # for it and hands back the plan so the caller can drop it.
+        self._stopped.set()
+        self._cancel.set()
+        self._done.wait()
+        return self._plan
+
+    def _run(self, exclude: List[str], delay_sec: float) -> None:
+        try:
+            self.clock.wait(self._cancel, delay_sec)
+            if self._stopped.is_set():
+                return
+            started = time.time()
+            self._plan = self.plan_func(exclude)
+            if self._plan is not None:
+                logger.info(
+                    f"Next cycle planned in {round(time.time() - started, 2)} sec | "
+                    f"Market: {self._plan.symbol} | Accounts: {len(self._plan.account_ids)}"
+                )
+        except BaseException as e:
+            self._error = e
+            logger.warning(f"Background cycle planning failed: {e}")
+        finally:
+            self._done.set()
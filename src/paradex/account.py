@@ -1,9 +1,11 @@
+from typing import List
+
 from starknet_py.net.account.account import Account
-import requests
 
+from src.paradex import client
 from src.paradex.auth import get_jwt_token
+from src.paradex.models import Balance, Position, parse_results
 from src.config.constants import PARADEX_HTTP_URL, logger
-from utils.proxy import convert_proxy_to_dict
 
 
 def get_auth_headers(account: Account, proxy_str: str) -> dict:
@@ -13,46 +15,49 @@ def get_auth_headers(account: Account, proxy_str: str) -> dict:
     }
 
 
-def get_balance(account: Account, proxy_str: str):
+def get_balance(account: Account, proxy_str: str) -> List[Balance]:
     headers = get_auth_headers(account, proxy_str)
-    response = requests.get(
+    response = client.get(
         f"{PARADEX_HTTP_URL}/balance",
+        proxy_str,
+        account_key=hex(account.address),
         headers=headers,
-        proxies=convert_proxy_to_dict(proxy_str),
     )
 
     if response.status_code != 200:
         logger.error(f"Error receiving balance: {response.text}")
-        raise ValueError("Error receiving balance")
+    client.raise_for_status(response, 200, "Error receiving balance")
 
-    return response.json()
+    return parse_results(response.json(), Balance)
 
 
-def get_open_positions(account: Account, proxy_str: str):
+def get_open_positions(account: Account, proxy_str: str) -> List[Position]:
     headers = get_auth_headers(account, proxy_str)
-    response = requests.get(
+    response = client.get(
         f"{PARADEX_HTTP_URL}/positions",
+        proxy_str,
+        account_key=hex(account.address),
         headers=headers,
-        proxies=convert_proxy_to_dict(proxy_str),
     )
 
     if response.status_code != 200:
         logger.error(f"Error receiving open positions: {response.text}")
-        raise ValueError("Error receiving open positions")
+    client.raise_for_status(response, 200, "Error receiving open positions")
 
-    return response.json()
+    return parse_results(response.json(), Position)
 
 
 def get_liquidation_price(account: Account, proxy_str: str):
     headers = get_auth_headers(account, proxy_str)
-    response = requests.get(
+    response = client.get(
         f"{PARADEX_HTTP_URL}/liquidation_price",
+        proxy_str,
+        account_key=hex(account.address),
         headers=headers,
-        proxies=convert_proxy_to_dict(proxy_str),
     )
 
     if response.status_code != 200:
         logger.error(f"Error receiving liquidation price: {response.text}")
-        raise ValueError("Error receiving liquidation price")
+    client.raise_for_status(response, 200, "Error receiving liquidation price")
 
     return response.json()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from starknet_py.net.account.account import Account
+
+from src.config.constants import (
+    PARADEX_HTTP_URL,
+    HTTP_CONNECT_TIMEOUT_SEC,
+    HTTP_READ_TIMEOUT_SEC,
+    logger,
+)
+from src.paradex.auth import build_auth_headers, token_manager
+from src.paradex.client import proxy_key, rate_limiter
+from src.paradex.models import Balance, Position, parse_results
+from utils.clock import get_clock
+from utils.general import _retry_request_async
+from utils.proxy import convert_proxy_to_dict
+from utils.rate_limit import endpoint_class
+from utils.retry import ParadexAPIError, get_breaker
+
+AccountState = Tuple[List[Balance], List[Position]]
+
+
+class AsyncParadexClient:
+    def __init__(self, concurrency: int, per_proxy_concurrency: int) -> None:
+        self.concurrency = concurrency
+        self.per_proxy_concurrency = per_proxy_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._proxy_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_proxy_concurrency)
+        )
+
+    async def __aenter__(self) -> "AsyncParadexClient":
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=HTTP_CONNECT_TIMEOUT_SEC,
+            sock_read=HTTP_READ_TIMEOUT_SEC,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+        token_manager.flush()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        proxy_str: Optional[str],
+        headers: Optional[dict] = None,
+        account_key: Optional[str] = None,
+    ) -> tuple:
+        proxy = convert_proxy_to_dict(proxy_str)["http"] if proxy_str else None
+        key = proxy_key(proxy_str)
+        breaker = get_breaker(key)
+        breaker.before_call()
+
+        async with self._proxy_semaphores[proxy_str or ""]:
+            await rate_limiter.acquire_async(endpoint_class(method, path), key, account_key)
+            try:
+                async with self._session.request(
+                    method,
+                    f"{PARADEX_HTTP_URL}{path}",
+                    headers=headers,
+                    proxy=proxy,
+                ) as response:
+                    text = await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                breaker.record_failure()
+                raise
+
+        if response.status == 429 or response.status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        if response.status not in (200, 201):
+            raise ParadexAPIError.from_response(
+                f"{method} {path} failed: {response.status} - {text}", response.status, text, response.headers
+            )
+        return response.status, text
+
+    async def get_jwt_token(self, account: Account, proxy_str: str) -> str:
+        private_key = hex(account.signer.private_key)
+        short_pk = private_key[:10]
+        now = int(time.time())
+
+        jwt = token_manager.peek(private_key)
+        if jwt:
+            return jwt
+
+        headers = await asyncio.to_thread(build_auth_headers, account, now, now + 24 * 60 * 60)
+        status, text = await self._request("POST", "/auth", proxy_str, headers, hex(account.address))
+
+        jwt = _parse_json(text).get("jwt_token", "")
+
+        if jwt:
+            token_manager.store(private_key, jwt, now)
+            logger.info(f"[{short_pk}] JWT token retrieved successfully")
+            return jwt
+
+        raise ValueError(f"Failed to get JWT token: {status} - {text}")
+
+    async def _get_private(self, account: Account, proxy_str: str, path: str) -> Dict[str, Any]:
+        jwt = await self.get_jwt_token(account, proxy_str)
+        _, text = await self._request(
+            "GET", path, proxy_str, {"authorization": f"Bearer {jwt}"}, hex(account.address)
+        )
+        return _parse_json(text)
+
+    async def get_balance(self, account: Account, proxy_str: str) -> List[Balance]:
+        try:
+            return parse_results(await self._get_private(account, proxy_str, "/balance"), Balance)
+        except ParadexAPIError as e:
+            logger.error(f"Error receiving balance: {e.text}")
+            raise
+
+    async def get_open_positions(self, account: Account, proxy_str: str) -> List[Position]:
+        try:
+            return parse_results(await self._get_private(account, proxy_str, "/positions"), Position)
+        except ParadexAPIError as e:
+            logger.error(f"Error receiving open positions: {e.text}")
+            raise
+
+
+async def fetch_accounts(
+    targets: List[Tuple[str, Account, Optional[str]]],
+    refresh_config: Dict[str, Any],
+) -> Dict[str, AccountState]:
+    semaphore = asyncio.Semaphore(refresh_config["concurrency"])
+    jitter = refresh_config.get("jitter_sec")
+
+    async def fetch(client: AsyncParadexClient, account: Account, proxy_str: Optional[str]) -> AccountState:
+        if jitter:
+            await get_clock().sleep_async(random.uniform(jitter["min"], jitter["max"]))
+
+        async with semaphore:
+            balances = await _retry_request_async(client.get_balance, account, proxy_str)
+            positions = await _retry_request_async(client.get_open_positions, account, proxy_str)
+        return balances, positions
+
+    async with AsyncParadexClient(refresh_config["concurrency"], refresh_config["per_proxy_concurrency"]) as client:
+        states = await asyncio.gather(*[fetch(client, account, proxy_str) for _, account, proxy_str in targets])
+    return {account_id: state for (account_id, _, _), state in zip(targets, states)}
+
+
+def _parse_json(text: str) -> Dict[str, Any]:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {}
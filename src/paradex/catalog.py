@@ -0,0 +1,67 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config.paths import FUTURE_PAIRS_PATH
+from src.paradex.models import Market
+from utils.data import load_json
+
+
+class MarketCatalog:
+    def __init__(self, path: str = FUTURE_PAIRS_PATH) -> None:
+        self.path = path
+        self._by_symbol: Dict[str, Market] = {}
+        self._by_base: Dict[str, Market] = {}
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def reload(self) -> None:
+        try:
+            mtime = os.stat(self.path).st_mtime
+            data = load_json(Path(self.path))
+        except (FileNotFoundError, json.JSONDecodeError) as exc:
+            raise RuntimeError(f"Failed to load pairs data from {self.path}") from exc
+
+        by_symbol = {}
+        by_base = {}
+        for item in data.get("results", []):
+            market = Market.from_dict(item)
+            by_symbol[market.symbol.upper()] = market
+            by_base.setdefault(market.base_currency.upper(), market)
+
+        with self._lock:
+            self._by_symbol = by_symbol
+            self._by_base = by_base
+            self._mtime = mtime
+
+    def _ensure_fresh(self) -> None:
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError as exc:
+            raise RuntimeError(f"Failed to load pairs data from {self.path}") from exc
+
+        if mtime != self._mtime:
+            self.reload()
+
+    def by_symbol(self, symbol: str) -> Market:
+        self._ensure_fresh()
+        market = self._by_symbol.get(symbol.upper())
+        if market is None:
+            raise ValueError(f"Symbol '{symbol}' not found in futures pairs")
+        return market
+
+    def by_base(self, token: str) -> Market:
+        self._ensure_fresh()
+        market = self._by_base.get(token.upper())
+        if market is None:
+            raise ValueError(f"Base_currency '{token}' not found in futures pairs")
+        return market
+
+    def symbols(self) -> List[str]:
+        self._ensure_fresh()
+        return [market.symbol for market in self._by_symbol.values()]
+
+
+market_catalog = MarketCatalog()
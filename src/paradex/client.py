@@ -0,0 +1,119 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config.constants import (
+    HTTP_CONNECT_TIMEOUT_SEC,
+    HTTP_READ_TIMEOUT_SEC,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+)
+from utils.proxy import convert_proxy_to_dict
+from utils.data import USER_CONFIG
+from utils.rate_limit import RateLimiter, endpoint_class
+from utils.retry import ParadexAPIError, get_breaker
+
+DEFAULT_TIMEOUT = (HTTP_CONNECT_TIMEOUT_SEC, HTTP_READ_TIMEOUT_SEC)
+
+rate_limiter = RateLimiter(USER_CONFIG["rate_limits"])
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session(proxy_str: Optional[str]) -> requests.Session:
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+
+    if proxy_str:
+        session.proxies.update(convert_proxy_to_dict(proxy_str))
+
+    return session
+
+
+def proxy_key(proxy_str: Optional[str]) -> str:
+    if not proxy_str:
+        return "proxy:direct"
+    return "proxy:" + ":".join(str(proxy_str).split(":")[:2])
+
+
+def get_session(proxy_str: Optional[str] = None) -> requests.Session:
+    key = proxy_str or ""
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session(proxy_str)
+            _sessions[key] = session
+        return session
+
+
+def request(
+    method: str,
+    url: str,
+    proxy_str: Optional[str] = None,
+    account_key: Optional[str] = None,
+    **kwargs,
+) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    key = proxy_key(proxy_str)
+    breaker = get_breaker(key)
+    breaker.before_call()
+
+    rate_limiter.acquire(endpoint_class(method, urlparse(url).path), key, account_key)
+
+    try:
+        response = get_session(proxy_str).request(method, url, **kwargs)
+    except (requests.Timeout, requests.ConnectionError):
+        breaker.record_failure()
+        raise
+
+    if response.status_code == 429 or response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def raise_for_status(response: requests.Response, expected: int, message: str) -> None:
+    if response.status_code != expected:
+        raise ParadexAPIError.from_response(
+            message, response.status_code, response.text, response.headers
+        )
+
+
+def get(url: str, proxy_str: Optional[str] = None, **kwargs) -> requests.Response:
+    return request("GET", url, proxy_str, **kwargs)
+
+
+def post(url: str, proxy_str: Optional[str] = None, **kwargs) -> requests.Response:
+    return request("POST", url, proxy_str, **kwargs)
+
+
+def delete(url: str, proxy_str: Optional[str] = None, **kwargs) -> requests.Response:
+    return request("DELETE", url, proxy_str, **kwargs)
+
+
+def close_sessions() -> None:
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,160 @@
+import base64
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from starknet_py.net.account.account import Account
+
+from src.config.constants import (
+    JWT_REFRESH_MARGIN_SEC,
+    JWT_REFRESH_POLL_SEC,
+    JWT_IDLE_SEC,
+    JWT_FALLBACK_TTL_SEC,
+    logger,
+)
+from utils.data import get_account_state, get_user_state, update_many
+
+
+def jwt_expiry(jwt: str, default: int) -> int:
+    try:
+        payload = jwt.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        return default
+
+
+class TokenManager:
+    def __init__(self, fetch: Callable[[Account, str], str]) -> None:
+        self._fetch = fetch
+        self._tokens: Dict[str, Tuple[str, int]] = {}
+        self._accounts: Dict[str, Tuple[Account, str]] = {}
+        self._last_used: Dict[str, float] = {}
+        self._loaded: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get_token(self, account: Account, proxy_str: str) -> str:
+        private_key = hex(account.signer.private_key)
+        self._register(private_key, account, proxy_str)
+
+        jwt = self.peek(private_key)
+        if jwt:
+            return jwt
+
+        return self._refresh(private_key)
+
+    def peek(self, private_key: str) -> Optional[str]:
+        self._load(private_key)
+        token = self._tokens.get(private_key)
+        # A token about to expire may lapse in flight; let _refresh replace it.
+        if token and time.time() + JWT_REFRESH_MARGIN_SEC < token[1]:
+            return token[0]
+        return None
+
+    def store(self, private_key: str, jwt: str, issued_at: int) -> None:
+        expiry = jwt_expiry(jwt, issued_at + JWT_FALLBACK_TTL_SEC)
+        with self._lock:
+            self._tokens[private_key] = (jwt, expiry)
+            self._dirty.add(private_key)
+
+    def warm(self, accounts: Iterable[Tuple[Account, str]]) -> None:
+        for account, proxy_str in accounts:
+            try:
+                self.get_token(account, proxy_str)
+            except Exception as e:
+                logger.warning(f"[{hex(account.signer.private_key)[:10]}] JWT warm-up failed: {e}")
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="jwt-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            dirty = [(pk, self._tokens[pk]) for pk in self._dirty]
+            self._dirty.clear()
+
+        for private_key, (jwt, expiry) in dirty:
+            update_many(private_key, {"jwt": jwt, "expiry": expiry})
+
+    def _register(self, private_key: str, account: Account, proxy_str: str) -> None:
+        self._accounts[private_key] = (account, proxy_str)
+        self._last_used[private_key] = time.time()
+        if self._thread is None:
+            self.start()
+
+    def _load(self, private_key: str) -> None:
+        if private_key in self._loaded:
+            return
+
+        state = get_account_state(private_key)
+        with self._lock:
+            self._loaded.add(private_key)
+            if state.get("jwt") and private_key not in self._tokens:
+                self._tokens[private_key] = (state["jwt"], int(state.get("expiry", 0)))
+
+    def _refresh(self, private_key: str) -> str:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(private_key, threading.Lock())
+
+        with key_lock:
+            token = self._tokens.get(private_key)
+            if token and time.time() + JWT_REFRESH_MARGIN_SEC < token[1]:
+                return token[0]
+
+            account, proxy_str = self._accounts[private_key]
+            now = int(time.time())
+            jwt = self._fetch(account, proxy_str)
+            self.store(private_key, jwt, now)
+            return jwt
+
+    def _holding_positions(self, private_keys: Iterable[str]) -> Set[str]:
+        private_keys = list(private_keys)
+        if not private_keys:
+            return set()
+        state = get_user_state()
+        return {pk for pk in private_keys if state.get(pk, {}).get("position") == "active"}
+
+    def _run(self) -> None:
+        while not self._stop.wait(JWT_REFRESH_POLL_SEC):
+            now = time.time()
+            idle = {pk for pk in list(self._accounts) if now - self._last_used.get(pk, 0) > JWT_IDLE_SEC}
+            # Idle accounts still holding a position stay warm: closing them
+            # hours later must not wait on /auth.
+            try:
+                holding = self._holding_positions(idle)
+            except Exception as e:
+                logger.warning(f"Failed to read positions for JWT refresh: {e}")
+                holding = idle
+
+            for private_key in list(self._accounts):
+                if private_key in idle and private_key not in holding:
+                    continue
+
+                token = self._tokens.get(private_key)
+                if token and now + JWT_REFRESH_MARGIN_SEC < token[1]:
+                    continue
+
+                try:
+                    self._refresh(private_key)
+                except Exception as e:
+                    logger.warning(f"[{private_key[:10]}] Background JWT refresh failed: {e}")
+
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to persist JWT tokens: {e}")
@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+
+ZERO = Decimal("0")
+
+
+def to_decimal(value: Any) -> Decimal:
+    if value is None or value == "":
+        return ZERO
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return ZERO
+
+
+@dataclass(frozen=True, slots=True)
+class Market:
+    symbol: str
+    base_currency: str
+    order_size_increment: Decimal
+    price_tick_size: Decimal
+    min_notional: Decimal
+    imf_base: Decimal
+    imf_shift: Decimal
+    imf_factor: Decimal
+    mmf_factor: Decimal
+    raw: Dict[str, Any] = field(compare=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Market":
+        margin = data.get("delta1_cross_margin_params") or {}
+        return cls(
+            symbol=data["symbol"],
+            base_currency=data["base_currency"],
+            order_size_increment=to_decimal(data["order_size_increment"]),
+            price_tick_size=to_decimal(data["price_tick_size"]),
+            min_notional=to_decimal(data["min_notional"]),
+            imf_base=to_decimal(margin.get("imf_base")),
+            imf_shift=to_decimal(margin.get("imf_shift")),
+            imf_factor=to_decimal(margin.get("imf_factor")),
+            mmf_factor=to_decimal(margin.get("mmf_factor")),
+            raw=data,
+        )
+
+
+@dataclass(slots=True)
+class Balance:
+    token: str
+    size: Decimal
+    last_updated_at: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Balance":
+        return cls(
+            token=data["token"],
+            size=to_decimal(data.get("size")),
+            last_updated_at=int(data.get("last_updated_at") or 0),
+        )
+
+
+@dataclass(slots=True)
+class Position:
+    id: str
+    market: str
+    side: str
+    status: str
+    size: Decimal
+    average_entry_price: Decimal
+    unrealized_pnl: Decimal
+    liquidation_price: Decimal
+    mark_price: Decimal
+
+    @property
+    def is_open(self) -> bool:
+        return self.status != "CLOSED"
+
+    @property
+    def abs_size(self) -> Decimal:
+        return abs(self.size)
+
+    @property
+    def close_side(self) -> str:
+        return "SELL" if self.side == "LONG" else "BUY"
+
+    @property
+    def ltv(self) -> Optional[float]:
+        if self.liquidation_price <= 0 or self.mark_price <= 0:
+            return None
+        if self.side == "SHORT":
+            return float(self.mark_price / self.liquidation_price)
+        if self.side == "LONG":
+            return float(self.liquidation_price / self.mark_price)
+        return None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Position":
+        side = str(data.get("side", "")).upper()
+        size = to_decimal(data.get("size"))
+        avg_price = to_decimal(data.get("average_entry_price"))
+        unrealized_pnl = to_decimal(data.get("unrealized_pnl"))
+
+        # /positions has no mark price; recover it from the unrealized PnL.
+        if size != 0:
+            direction = -1 if side == "SHORT" else 1
+            mark_price = unrealized_pnl / (abs(size) * direction) + avg_price
+        else:
+            mark_price = ZERO
+
+        return cls(
+            id=str(data.get("id", "")),
+            market=str(data.get("market", "")),
+            side=side,
+            status=str(data.get("status", "")).upper(),
+            size=size,
+            average_entry_price=avg_price,
+            unrealized_pnl=unrealized_pnl,
+            liquidation_price=to_decimal(data.get("liquidation_price")),
+            mark_price=mark_price,
+        )
+
+
+@dataclass(slots=True)
+class Order:
+    id: str
+    market: str
+    side: str
+    type: str
+    status: str
+    size: Decimal
+    remaining_size: Decimal
+    avg_fill_price: Decimal
+    cancel_reason: str
+    raw: Dict[str, Any] = field(compare=False, repr=False)
+
+    @property
+    def filled_size(self) -> Decimal:
+        return self.size - self.remaining_size
+
+    @property
+    def avg_price(self) -> Decimal:
+        return self.avg_fill_price
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status == "CLOSED" or bool(self.cancel_reason)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Order":
+        size = to_decimal(data.get("size"))
+        remaining = data.get("remaining_size")
+        return cls(
+            id=str(data.get("id", "")),
+            market=str(data.get("market", "")),
+            side=str(data.get("side", "")).upper(),
+            type=str(data.get("type", "")).upper(),
+            status=str(data.get("status", "")).upper(),
+            size=size,
+            remaining_size=size if remaining in (None, "") else to_decimal(remaining),
+            avg_fill_price=to_decimal(data.get("avg_fill_price")),
+            cancel_reason=(data.get("cancel_reason") or "").strip(),
+            raw=data,
+        )
+
+
+@dataclass(slots=True)
+class BBO:
+    market: str
+    bid: Decimal
+    ask: Decimal
+    last_updated_at: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], market: str = "") -> "BBO":
+        return cls(
+            market=str(data.get("market") or market),
+            bid=to_decimal(data["bid"]),
+            ask=to_decimal(data["ask"]),
+            last_updated_at=int(data.get("last_updated_at") or 0),
+        )
+
+
+def parse_results(data: Dict[str, Any], model: Any) -> List[Any]:
+    return [model.from_dict(item) for item in data.get("results", [])]
@@ -0,0 +1,53 @@
+import threading
+from typing import Any, Dict, List
+
+from src.config.constants import PARADEX_HTTP_URL, PRICE_SNAPSHOT_TTL_SEC, logger
+from src.paradex import client
+from src.paradex.ws_feed import PriceTable, PriceTick
+from utils.clock import get_clock
+
+
+class PriceSnapshot:
+    def __init__(self, ttl_sec: float = PRICE_SNAPSHOT_TTL_SEC) -> None:
+        self.ttl_sec = ttl_sec
+        self.table = PriceTable()
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def fetch_summary(self) -> List[Dict[str, Any]]:
+        response = client.get(f"{PARADEX_HTTP_URL}/markets/summary", params={"market": "ALL"})
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch market data: {response.status_code} - {response.text}")
+        client.raise_for_status(response, 200, "Failed to fetch market summary")
+
+        results = response.json().get("results", [])
+        for item in results:
+            fields = {}
+            for name in ("bid", "ask", "mark_price"):
+                try:
+                    fields[name] = float(item[name])
+                except (KeyError, TypeError, ValueError):
+                    pass
+            if "symbol" in item and fields:
+                self.table.update(item["symbol"], **fields)
+
+        self._fetched_at = get_clock().time()
+        return results
+
+    def get(self, symbol: str) -> PriceTick:
+        if get_clock().time() - self._fetched_at > self.ttl_sec:
+            with self._lock:
+                if get_clock().time() - self._fetched_at > self.ttl_sec:
+                    self.fetch_summary()
+
+        tick = self.table.get(symbol)
+        if tick is None or tick.price <= 0:
+            logger.error(f"No price for {symbol} in markets summary")
+            raise ValueError("Error receiving token price")
+        return tick
+
+    def get_price(self, symbol: str) -> float:
+        return self.get(symbol).price
+
+
+price_snapshot = PriceSnapshot()
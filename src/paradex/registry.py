@@ -0,0 +1,118 @@
+import threading
+from typing import Dict, List, Optional
+
+from starknet_py.common import int_from_bytes
+from starknet_py.net.account.account import Account
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+from src.config.constants import STARKNET_FULLNODE_RPC_URL, STARKNET_CHAIN_ID, logger
+from utils.account_store import load_accounts
+from utils.stark import hex_to_int
+
+CHAIN_ID = int_from_bytes(STARKNET_CHAIN_ID.encode("utf-8"))
+
+
+class AccountEntry:
+    __slots__ = ("account_id", "address", "private_key", "proxy", "is_active", "_account")
+
+    def __init__(self, private_key: str, address: str, proxy: Optional[str], is_active: bool) -> None:
+        self.account_id = hex(hex_to_int(private_key))
+        self.address = address
+        self.private_key = private_key
+        self.proxy = proxy
+        self.is_active = is_active
+        self._account: Optional[Account] = None
+
+    @property
+    def short_pk(self) -> str:
+        return self.account_id[:10]
+
+
+class AccountRegistry:
+    def __init__(self) -> None:
+        self._entries: Dict[str, AccountEntry] = {}
+        self._client: Optional[FullNodeClient] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> FullNodeClient:
+        if self._client is None:
+            self._client = FullNodeClient(node_url=STARKNET_FULLNODE_RPC_URL)
+        return self._client
+
+    def load(self) -> None:
+        df = load_accounts()
+
+        entries = {}
+        for row in df.itertuples(index=False):
+            proxy = row.proxy if isinstance(row.proxy, str) else None
+            entry = AccountEntry(str(row.private_key), str(row.address), proxy, bool(row.is_active == True))
+            previous = self._entries.get(entry.account_id)
+            if previous is not None and previous.address == entry.address:
+                entry._account = previous._account
+            entries[entry.account_id] = entry
+
+        with self._lock:
+            self._entries = entries
+            self._loaded = True
+        logger.debug(f"Account registry loaded: {len(entries)} accounts")
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def ids(self, active_only: bool = True) -> List[str]:
+        self._ensure_loaded()
+        return [
+            account_id for account_id, entry in self._entries.items()
+            if entry.is_active or not active_only
+        ]
+
+    def entry(self, account_id: str) -> AccountEntry:
+        self._ensure_loaded()
+        try:
+            return self._entries[account_id]
+        except KeyError:
+            raise ValueError(f"Account '{account_id[:10]}' not found in accounts registry")
+
+    def get(self, account_id: str) -> Account:
+        return self._build(self.entry(account_id))
+
+    def get_account(self, account_address: str, account_key: str) -> Account:
+        account_id = hex(hex_to_int(account_key))
+        entry = self._entries.get(account_id)
+
+        if entry is None or entry.address != account_address:
+            proxy = entry.proxy if entry is not None else None
+            entry = AccountEntry(account_key, account_address, proxy, True)
+            with self._lock:
+                self._entries[account_id] = entry
+
+        return self._build(entry)
+
+    def _build(self, entry: AccountEntry) -> Account:
+        if entry._account is not None:
+            return entry._account
+
+        with self._lock:
+            if entry._account is None:
+                key_pair = KeyPair.from_private_key(key=hex_to_int(entry.private_key))
+                entry._account = Account(
+                    client=self.client,
+                    address=entry.address,
+                    key_pair=key_pair,
+                    chain=CHAIN_ID,
+                )
+        return entry._account
+
+
+_registry: Optional[AccountRegistry] = None
+
+
+def get_registry() -> AccountRegistry:
+    global _registry
+    if _registry is None:
+        _registry = AccountRegistry()
+    return _registry
@@ -0,0 +1,301 @@
+import argparse
+import base64
+import json
+import random
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from src.paradex.ws_stub import DEFAULT_PRICE, StubMarket
+
+DEFAULT_BALANCE = 1000.0
+IMF_BASE = 0.05
+MMF_FACTOR = 0.5
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _b64(data: Dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def _error(status: int, message: str) -> web.Response:
+    return web.json_response({"error": message, "message": message}, status=status)
+
+
+class StubPosition:
+    def __init__(self, market: str) -> None:
+        self.id = uuid.uuid4().hex
+        self.market = market
+        self.size = 0.0
+        self.entry_price = 0.0
+
+    def fill(self, size: float, price: float) -> float:
+        # Returns the PnL realized by the reducing part of the fill.
+        if self.size == 0 or (self.size > 0) == (size > 0):
+            total = self.size + size
+            self.entry_price = (self.size * self.entry_price + size * price) / total
+            self.size = total
+            return 0.0
+
+        closed = min(abs(size), abs(self.size))
+        direction = 1 if self.size > 0 else -1
+        pnl = closed * direction * (price - self.entry_price)
+        self.size += size
+        if abs(self.size) < 1e-12:
+            self.size = 0.0
+        elif (self.size > 0) != (direction > 0):
+            self.entry_price = price
+        return pnl
+
+
+class StubExchange:
+    def __init__(
+        self, markets: Dict[str, StubMarket], balance: float, error_rate: float, lost_ack_rate: float = 0.0
+    ) -> None:
+        self.markets = markets
+        self.balance = balance
+        self.error_rate = error_rate
+        self.lost_ack_rate = lost_ack_rate
+        self.balances: Dict[str, float] = {}
+        self.positions: Dict[str, Dict[str, StubPosition]] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.client_ids: Dict[str, str] = {}
+
+    def price(self, symbol: str) -> float:
+        market = self.markets.get(symbol)
+        return market.price if market is not None else 0.0
+
+    def quote(self, symbol: str) -> Dict[str, str]:
+        price = self.price(symbol)
+        spread = price * 0.0001
+        return {"bid": str(round(price - spread, 6)), "ask": str(round(price + spread, 6))}
+
+    def account(self, request: web.Request) -> Optional[str]:
+        token = request.headers.get("Authorization", "").split("Bearer ")[-1]
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return json.loads(base64.urlsafe_b64decode(payload))["sub"]
+        except (IndexError, KeyError, ValueError):
+            return None
+
+    def liquidation_price(self, address: str, position: StubPosition) -> float:
+        balance = self.balances.get(address, self.balance)
+        size, entry = position.size, position.entry_price
+        # imf_factor is 0, so the initial margin fraction is imf_base at any size.
+        mmf = IMF_BASE * MMF_FACTOR
+        denominator = size * (1 - (1 if size > 0 else -1) * mmf)
+        price = (size * entry - balance) / denominator if denominator else 0.0
+        return max(price, 0.0)
+
+    def position_dict(self, address: str, position: StubPosition) -> Dict[str, Any]:
+        mark = self.price(position.market)
+        is_open = position.size != 0
+        liquidation_price = self.liquidation_price(address, position) if is_open else 0.0
+        return {
+            "id": position.id,
+            "market": position.market,
+            "side": "LONG" if position.size > 0 else "SHORT" if position.size < 0 else "",
+            "status": "OPEN" if is_open else "CLOSED",
+            "size": str(round(position.size, 8)),
+            "average_entry_price": str(round(position.entry_price, 6)),
+            "unrealized_pnl": str(round(position.size * (mark - position.entry_price), 6)),
+            "liquidation_price": str(round(liquidation_price, 6)) if liquidation_price else "",
+            "last_updated_at": _now_ms(),
+        }
+
+    def place_order(self, address: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        market = body["market"]
+        side = body["side"].upper()
+        size = float(body["size"])
+        quote = self.quote(market)
+        price = float(quote["ask"] if side == "BUY" else quote["bid"])
+
+        position = self.positions.setdefault(address, {}).setdefault(market, StubPosition(market))
+        pnl = position.fill(size if side == "BUY" else -size, price)
+        self.balances[address] = self.balances.get(address, self.balance) + pnl
+
+        order = {
+            "id": uuid.uuid4().hex,
+            "client_id": body.get("client_id", ""),
+            "market": market,
+            "side": side,
+            "type": body.get("type", "MARKET"),
+            "size": body["size"],
+            "remaining_size": "0",
+            "avg_fill_price": str(price),
+            "status": "CLOSED",
+            "cancel_reason": "",
+            "created_at": _now_ms(),
+        }
+        self.orders[order["id"]] = order
+        if order["client_id"]:
+            self.client_ids[order["client_id"]] = order["id"]
+        return order
+
+
+def make_app(exchange: StubExchange) -> web.Application:
+    @web.middleware
+    async def inject_errors(request: web.Request, handler):
+        if exchange.error_rate and random.random() < exchange.error_rate:
+            return _error(503, "Injected outage")
+        return await handler(request)
+
+    async def auth(request: web.Request) -> web.Response:
+        address = request.headers.get("PARADEX-STARKNET-ACCOUNT")
+        if not address:
+            return _error(400, "PARADEX-STARKNET-ACCOUNT header is required")
+        token = ".".join([
+            _b64({"alg": "none", "typ": "JWT"}),
+            _b64({"sub": address, "exp": int(time.time()) + 300}),
+            "stub",
+        ])
+        return web.json_response({"jwt_token": token})
+
+    def private(handler):
+        async def wrapper(request: web.Request) -> web.Response:
+            address = exchange.account(request)
+            if address is None:
+                return _error(401, "Invalid JWT")
+            return await handler(request, address)
+        return wrapper
+
+    @private
+    async def balance(request: web.Request, address: str) -> web.Response:
+        size = exchange.balances.get(address, exchange.balance)
+        return web.json_response({
+            "results": [{"token": "USDC", "size": str(round(size, 6)), "last_updated_at": _now_ms()}]
+        })
+
+    @private
+    async def positions(request: web.Request, address: str) -> web.Response:
+        return web.json_response({
+            "results": [
+                exchange.position_dict(address, position)
+                for position in exchange.positions.get(address, {}).values()
+            ]
+        })
+
+    @private
+    async def create_order(request: web.Request, address: str) -> web.Response:
+        body = await request.json()
+        if body.get("market") not in exchange.markets:
+            return _error(400, f"Unknown market {body.get('market')}")
+        if body.get("client_id") in exchange.client_ids:
+            return _error(400, "CLIENT_ORDER_ID_ALREADY_EXISTS")
+        order = exchange.place_order(address, body)
+        if exchange.lost_ack_rate and random.random() < exchange.lost_ack_rate:
+            # The order is live, but the client only sees the error and has
+            # to find it by client_id.
+            return _error(503, "Injected outage after accepting the order")
+        # The exchange acknowledges with the order still open; polling sees the fill.
+        return web.json_response(dict(order, status="NEW", remaining_size=order["size"]), status=201)
+
+    @private
+    async def get_order(request: web.Request, address: str) -> web.Response:
+        order = exchange.orders.get(request.match_info["order_id"])
+        if order is None:
+            return _error(404, "ORDER_ID_NOT_FOUND")
+        return web.json_response(order)
+
+    @private
+    async def get_order_by_client_id(request: web.Request, address: str) -> web.Response:
+        order_id = exchange.client_ids.get(request.match_info["client_id"])
+        if order_id is None:
+            return _error(404, "ORDER_ID_NOT_FOUND")
+        return web.json_response(exchange.orders[order_id])
+
+    @private
+    async def cancel_order(request: web.Request, address: str) -> web.Response:
+        if request.match_info["order_id"] not in exchange.orders:
+            return _error(404, "ORDER_ID_NOT_FOUND")
+        return web.Response(status=204)
+
+    async def markets(request: web.Request) -> web.Response:
+        return web.json_response({
+            "results": [
+                {
+                    "symbol": symbol,
+                    "base_currency": symbol.split("-")[0],
+                    "quote_currency": "USD",
+                    "settlement_currency": "USDC",
+                    "asset_kind": "PERP",
+                    "order_size_increment": "0.001",
+                    "price_tick_size": "0.01",
+                    "min_notional": "10",
+                    "delta1_cross_margin_params": {
+                        "imf_base": str(IMF_BASE), "imf_shift": "0", "imf_factor": "0", "mmf_factor": str(MMF_FACTOR),
+                    },
+                }
+                for symbol in exchange.markets
+            ]
+        })
+
+    async def markets_summary(request: web.Request) -> web.Response:
+        # One tick per summary request, so the price path follows the
+        # client's polling rather than wall time.
+        results = []
+        for symbol, market in exchange.markets.items():
+            market.step()
+            results.append(dict(
+                exchange.quote(symbol),
+                symbol=symbol,
+                mark_price=str(round(market.price, 6)),
+                last_traded_price=str(round(market.price, 6)),
+                created_at=_now_ms(),
+            ))
+        return web.json_response({"results": results})
+
+    async def bbo(request: web.Request) -> web.Response:
+        symbol = request.match_info["market"]
+        if symbol not in exchange.markets:
+            return _error(404, f"Unknown market {symbol}")
+        return web.json_response(dict(exchange.quote(symbol), market=symbol, last_updated_at=_now_ms()))
+
+    app = web.Application(middlewares=[inject_errors])
+    app.add_routes([
+        web.post("/v1/auth", auth),
+        web.get("/v1/balance", balance),
+        web.get("/v1/positions", positions),
+        web.post("/v1/orders", create_order),
+        web.get("/v1/orders/by_client_id/{client_id}", get_order_by_client_id),
+        web.get("/v1/orders/{order_id}", get_order),
+        web.delete("/v1/orders/{order_id}", cancel_order),
+        web.get("/v1/markets", markets),
+        web.get("/v1/markets/summary", markets_summary),
+        web.get("/v1/bbo/{market}", bbo),
+    ])
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Paradex REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--balance", type=float, default=DEFAULT_BALANCE, help="Starting USDC balance per account")
+    parser.add_argument("--volatility", type=float, default=0.001, help="Per-tick price stddev (fraction)")
+    parser.add_argument("--drift", type=float, default=0.0, help="Per-tick price drift (fraction)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument(
+        "--lost-ack-rate", type=float, default=0.0, help="Fraction of orders accepted but answered with 503"
+    )
+    parser.add_argument("--price", action="append", default=[], help="Initial price, e.g. ETH-USD-PERP=2500")
+    args = parser.parse_args()
+
+    markets = {}
+    for item in args.price or [f"ETH-USD-PERP={DEFAULT_PRICE}"]:
+        symbol, price = item.split("=")
+        markets[symbol] = StubMarket(float(price), args.volatility, args.drift)
+
+    exchange = StubExchange(markets, args.balance, args.error_rate, args.lost_ack_rate)
+    print(f"Paradex REST stub listening on http://{args.host}:{args.port}/v1")
+    web.run_app(make_app(exchange), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
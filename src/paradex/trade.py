@@ -1,16 +1,43 @@
 import time
-import requests
+import uuid
 from decimal import Decimal
+from typing import List, Optional
 from starknet_py.net.account.account import Account
 
-from utils.stark import build_trade_message
-from utils.data import update_state
+from utils.signing import get_signing_engine
+from utils.account_store import get_account_store
+from utils.clock import get_clock
+from utils.data import update_many
+from utils.general import _retry_request
+from utils.retry import (
+    ORDER_RETRY_KINDS,
+    OrderRejectedError,
+    OrderSubmittedError,
+    ParadexAPIError,
+    RetryPolicy,
+    classify_error,
+)
+from src.paradex import client
 from src.paradex.auth import get_jwt_token
-from src.config.constants import PARADEX_HTTP_URL, logger
-from utils.proxy import convert_proxy_to_dict
+from src.paradex.models import Order
+from src.config.constants import (
+    PARADEX_HTTP_URL,
+    ORDER_FILL_TIMEOUT_SEC,
+    ORDER_POLL_INITIAL_DELAY_SEC,
+    ORDER_POLL_MAX_DELAY_SEC,
+    ORDER_SETTLE_TIMEOUT_SEC,
+    logger,
+)
 
 
-def open_position(account: Account, side: str, market: str, size: str, proxy_str):
+def open_position(
+    account: Account,
+    side: str,
+    market: str,
+    size: str,
+    proxy_str,
+    client_id: Optional[str] = None,
+) -> Order:
     private_key = hex(account.signer.private_key)
     short_pk = private_key[:10]
 
@@ -28,16 +55,17 @@ def open_position(account: Account, side: str, market: str, size: str, proxy_str
         "size": size,
         "signature_timestamp": signature_timestamp_ms,
     }
+    if client_id:
+        order_payload["client_id"] = client_id
 
-    signable = build_trade_message(
+    sig = get_signing_engine().sign_order(
+        account,
         market=order_payload["market"],
         order_type=order_payload["type"],
         order_side=order_payload["side"],
         size=Decimal(order_payload["size"]),
         timestamp=order_payload["signature_timestamp"],
     )
-
-    sig = account.sign_message(signable)
     signature_str = f'["{hex(sig[0])}","{hex(sig[1])}"]'
     order_payload["signature"] = signature_str
 
@@ -48,42 +76,132 @@ def open_position(account: Account, side: str, market: str, size: str, proxy_str
     }
 
     url = f"{PARADEX_HTTP_URL}/orders"
-    response = requests.post(
+    response = client.post(
         url,
+        proxy_str,
+        account_key=hex(account.address),
         headers=headers,
         json=order_payload,
-        proxies=convert_proxy_to_dict(proxy_str),
     )
 
     if response.status_code == 201:
-        order = response.json()
-        order_id = order["id"]
-        order_info = get_order_info_by_id(account, order_id, proxy_str)
-
-        cancel_reason = order_info.get("cancel_reason", "").strip()
-
-        if cancel_reason:
-            logger.error(
-                f"[{short_pk}] {order_payload['side']} {order_payload['size']} {order_payload['market']} — "
-                f"failed: {cancel_reason}"
-            )
-            raise ValueError("Error opening a new position")
-
-        update_state(private_key, "last_order", order)
-        logger.success(
-            f"[{short_pk}] {order['side']} {order['size']} {order['market']} — "
-            f"market order sent (id: {order['id'][:10]}...)"
-        )
-        return True
+        get_account_store().mark_touched([private_key])
+        order = Order.from_dict(response.json())
+        try:
+            fill = wait_for_order(account, order.id, proxy_str)
+        except Exception as e:
+            raise OrderSubmittedError(order.id, f"Order {order.id[:10]}... accepted but not confirmed: {e}") from e
+
+        return _record_fill(account, fill, order)
 
     logger.error(
         f"[{short_pk}] {order_payload['side']} {order_payload['size']} {order_payload['market']} — "
         f"failed: {response.text}"
     )
-    raise ValueError("Error opening a new position")
+    client.raise_for_status(response, 201, "Error opening a new position")
+
+
+def place_order(
+    account: Account,
+    side: str,
+    market: str,
+    size: str,
+    proxy_str: str,
+    policy: RetryPolicy,
+    breaker_key: Optional[str] = None,
+) -> Order:
+    # Retries reuse the client id so a lookup can find an earlier attempt; a
+    # confirmed rejection gets a fresh one, since the exchange refuses
+    # duplicate ids. Every id issued stays in the list for reconciliation.
+    client_ids = [uuid.uuid4().hex]
+    try:
+        return policy.call(
+            _submit_order, account, side, market, size, proxy_str, client_ids, breaker_key=breaker_key
+        )
+    except OrderSubmittedError as e:
+        logger.warning(f"[{hex(account.signer.private_key)[:10]}] {e}. Reconciling instead of re-sending")
+        return settle_order(account, e.order_id, proxy_str)
+
+
+def _submit_order(
+    account: Account, side: str, market: str, size: str, proxy_str: str, client_ids: List[str]
+) -> Order:
+    try:
+        return open_position(account, side, market, size, proxy_str, client_ids[-1])
+    except OrderRejectedError:
+        client_ids.append(uuid.uuid4().hex)
+        raise
+    except Exception as e:
+        if classify_error(e) in ORDER_RETRY_KINDS + ("client", "submitted"):
+            raise
+        # A timeout or 5xx may hide an accepted order: look it up before anything re-sends.
+        order = _find_accepted_order(account, client_ids, proxy_str)
+        if order is None:
+            client_ids.append(uuid.uuid4().hex)
+            raise OrderRejectedError(f"Order was not accepted: {e}") from e
+        raise OrderSubmittedError(order.id, f"Order {order.id[:10]}... accepted despite error: {e}") from e
+
+
+def _find_accepted_order(account: Account, client_ids: List[str], proxy_str: str) -> Optional[Order]:
+    # Newest first. An order that ended unfilled was a confirmed rejection,
+    # and its id was already replaced.
+    for client_id in reversed(client_ids):
+        order = _retry_request(get_order_by_client_id, account, client_id, proxy_str)
+        if order is not None and not (order.is_terminal and order.filled_size <= 0):
+            return order
+    return None
+
+
+def settle_order(account: Account, order_id: str, proxy_str: str) -> Order:
+    try:
+        fill = wait_for_order(account, order_id, proxy_str, ORDER_SETTLE_TIMEOUT_SEC)
+    except TimeoutError:
+        logger.warning(f"[{hex(account.signer.private_key)[:10]}] Order {order_id[:10]}... still open. Cancelling")
+        _retry_request(cancel_order, account, order_id, proxy_str)
+        fill = wait_for_order(account, order_id, proxy_str, ORDER_SETTLE_TIMEOUT_SEC)
+
+    return _record_fill(account, fill, fill)
+
+
+def _record_fill(account: Account, fill: Order, last_order: Order) -> Order:
+    private_key = hex(account.signer.private_key)
+    short_pk = private_key[:10]
+
+    if fill.filled_size <= 0:
+        logger.error(f"[{short_pk}] {fill.side} {fill.size} {fill.market} — failed: {fill.cancel_reason or fill.status}")
+        raise OrderRejectedError(f"Order {fill.id[:10]}... ended unfilled: {fill.cancel_reason or fill.status}")
+
+    if fill.cancel_reason:
+        logger.warning(
+            f"[{short_pk}] {fill.side} {fill.market} partially filled: "
+            f"{fill.filled_size} of {fill.size} ({fill.cancel_reason})"
+        )
+
+    update_many(private_key, {
+        "last_order": last_order.raw,
+        "last_fill": {"filled_size": str(fill.filled_size), "avg_price": str(fill.avg_price)},
+    })
+    logger.success(
+        f"[{short_pk}] {fill.side} {fill.filled_size} {fill.market} @ {fill.avg_price} — "
+        f"market order filled (id: {fill.id[:10]}...)"
+    )
+    return fill
+
+
+def cancel_order(account: Account, order_id: str, proxy_str: str) -> None:
+    jwt = get_jwt_token(account, proxy_str)
+    if not jwt:
+        raise ValueError("JWT token is empty, auth failed")
+
+    headers = {"Accept": "application/json", "Authorization": f"Bearer {jwt}"}
+    url = f"{PARADEX_HTTP_URL}/orders/{order_id}"
+
+    response = client.delete(url, proxy_str, account_key=hex(account.address), headers=headers)
+    if response.status_code not in (200, 204, 404):
+        client.raise_for_status(response, 204, f"Error cancelling order {order_id[:10]}...")
 
 
-def get_order_info_by_id(account: Account, order_id: str, proxy_str: str) -> dict:
+def get_order_info_by_id(account: Account, order_id: str, proxy_str: str) -> Order:
     jwt = get_jwt_token(account, proxy_str)
     if not jwt:
         raise ValueError("JWT token is empty, auth failed")
@@ -96,6 +214,65 @@ def get_order_info_by_id(account: Account, order_id: str, proxy_str: str) -> dic
 
     url = f"{PARADEX_HTTP_URL}/orders/{order_id}"
 
-    response = requests.get(url, headers=headers, proxies=convert_proxy_to_dict(proxy_str))
+    response = client.get(url, proxy_str, account_key=hex(account.address), headers=headers)
+    client.raise_for_status(response, 200, f"Error receiving order {order_id[:10]}...")
+
+    return Order.from_dict(response.json())
+
+
+def get_order_by_client_id(account: Account, client_id: str, proxy_str: str) -> Optional[Order]:
+    jwt = get_jwt_token(account, proxy_str)
+    if not jwt:
+        raise ValueError("JWT token is empty, auth failed")
 
-    return response.json()
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "Authorization": f"Bearer {jwt}",
+    }
+
+    url = f"{PARADEX_HTTP_URL}/orders/by_client_id/{client_id}"
+
+    response = client.get(url, proxy_str, account_key=hex(account.address), headers=headers)
+    if response.status_code == 404:
+        return None
+    client.raise_for_status(response, 200, f"Error receiving order by client id {client_id[:10]}...")
+
+    return Order.from_dict(response.json())
+
+
+def wait_for_order(
+    account: Account,
+    order_id: str,
+    proxy_str: str,
+    timeout_sec: float = ORDER_FILL_TIMEOUT_SEC,
+) -> Order:
+    clock = get_clock()
+    deadline = clock.time() + timeout_sec
+    delay = ORDER_POLL_INITIAL_DELAY_SEC
+
+    status = "UNKNOWN"
+
+    while True:
+        try:
+            fill = get_order_info_by_id(account, order_id, proxy_str)
+            if fill.is_terminal:
+                return fill
+            status = fill.status
+        except Exception as e:
+            # A fresh order can 404 for a moment; throttling and outages pass too.
+            if not _transient_poll_error(e):
+                raise
+            logger.debug(f"Polling order {order_id[:10]}... failed: {e}")
+
+        if clock.time() + delay > deadline:
+            raise TimeoutError(f"Order {order_id[:10]}... not filled after {timeout_sec} sec (status: {status})")
+
+        clock.sleep(delay)
+        delay = min(delay * 2, ORDER_POLL_MAX_DELAY_SEC)
+
+
+def _transient_poll_error(exc: BaseException) -> bool:
+    if isinstance(exc, ParadexAPIError) and exc.status_code == 404:
+        return True
+    return classify_error(exc) in ("timeout", "rate_limit", "server", "circuit_open")
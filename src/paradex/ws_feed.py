@@ -0,0 +1,144 @@
+import asyncio
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set
+
+import websockets
+
+from src.config.constants import PARADEX_WS_URL, logger
+from src.paradex.models import BBO
+
+
+@dataclass(slots=True)
+class PriceTick:
+    symbol: str
+    bid: float = 0.0
+    ask: float = 0.0
+    mark_price: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def price(self) -> float:
+        if self.bid > 0 and self.ask > 0:
+            return (self.bid + self.ask) / 2
+        return self.mark_price
+
+
+class PriceTable:
+    def __init__(self) -> None:
+        self._ticks: Dict[str, PriceTick] = {}
+        self._lock = threading.Lock()
+
+    def update(self, symbol: str, **fields: float) -> PriceTick:
+        with self._lock:
+            tick = self._ticks.get(symbol)
+            if tick is None:
+                tick = self._ticks[symbol] = PriceTick(symbol)
+            for name, value in fields.items():
+                setattr(tick, name, value)
+            tick.updated_at = time.time()
+            return tick
+
+    def get(self, symbol: str) -> Optional[PriceTick]:
+        return self._ticks.get(symbol)
+
+
+class MarketDataFeed:
+    def __init__(self, url: str = PARADEX_WS_URL, max_reconnect_delay_sec: float = 30.0) -> None:
+        self.url = url
+        self.max_reconnect_delay_sec = max_reconnect_delay_sec
+        self.prices = PriceTable()
+        self._symbols: Set[str] = set()
+        self._updates: "queue.Queue[str]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, symbols: Iterable[str]) -> None:
+        self._symbols.update(symbols)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="market-data-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def next_updates(self, timeout: float) -> Set[str]:
+        try:
+            symbols = {self._updates.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+
+        while True:
+            try:
+                symbols.add(self._updates.get_nowait())
+            except queue.Empty:
+                return symbols
+
+    def _run(self) -> None:
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        delay = 1.0
+        while not self._stop.is_set():
+            try:
+                async with websockets.connect(self.url, ping_interval=20) as ws:
+                    for request_id, symbol in enumerate(sorted(self._symbols), start=1):
+                        await self._subscribe(ws, request_id * 2 - 1, f"bbo.{symbol}")
+                        await self._subscribe(ws, request_id * 2, f"markets_summary.{symbol}")
+                    logger.debug(f"Market data feed connected: {len(self._symbols)} markets")
+                    delay = 1.0
+
+                    while not self._stop.is_set():
+                        try:
+                            raw = await asyncio.wait_for(ws.recv(), timeout=1)
+                        except asyncio.TimeoutError:
+                            continue
+                        self._handle(raw)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.warning(f"Market data feed disconnected: {e}. Reconnecting in {delay} sec..")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay_sec)
+
+    async def _subscribe(self, ws, request_id: int, channel: str) -> None:
+        await ws.send(json.dumps({
+            "jsonrpc": "2.0",
+            "method": "subscribe",
+            "params": {"channel": channel},
+            "id": request_id,
+        }))
+
+    def _handle(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+
+        if message.get("method") != "subscription":
+            return
+
+        params = message.get("params", {})
+        channel = params.get("channel", "")
+        data = params.get("data", {})
+
+        try:
+            if channel.startswith("bbo."):
+                bbo = BBO.from_dict(data, channel.split(".", 1)[1])
+                symbol = bbo.market
+                self.prices.update(symbol, bid=float(bbo.bid), ask=float(bbo.ask))
+            elif channel.startswith("markets_summary"):
+                symbol = data.get("symbol") or channel.split(".", 1)[1]
+                self.prices.update(symbol, mark_price=float(data["mark_price"]))
+            else:
+                return
+        except (KeyError, ValueError, TypeError):
+            logger.debug(f"Invalid market data message: {data}")
+            return
+
+        self._updates.put(symbol)
@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict
+
+import websockets
+
+DEFAULT_PRICE = 100.0
+
+
+class StubMarket:
+    def __init__(self, price: float, volatility: float, drift: float) -> None:
+        self.price = price
+        self.volatility = volatility
+        self.drift = drift
+
+    def step(self) -> float:
+        self.price *= 1 + self.drift + random.gauss(0, self.volatility)
+        return self.price
+
+
+def _bbo_message(symbol: str, price: float) -> str:
+    spread = price * 0.0001
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "method": "subscription",
+        "params": {
+            "channel": f"bbo.{symbol}",
+            "data": {
+                "market": symbol,
+                "bid": str(round(price - spread, 6)),
+                "ask": str(round(price + spread, 6)),
+                "last_updated_at": int(time.time() * 1000),
+            },
+        },
+    })
+
+
+def _summary_message(symbol: str, price: float) -> str:
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "method": "subscription",
+        "params": {
+            "channel": f"markets_summary.{symbol}",
+            "data": {
+                "symbol": symbol,
+                "mark_price": str(round(price, 6)),
+                "created_at": int(time.time() * 1000),
+            },
+        },
+    })
+
+
+async def _serve_client(ws, markets: Dict[str, StubMarket], args) -> None:
+    channels = set()
+
+    async def publish() -> None:
+        while True:
+            await asyncio.sleep(args.interval)
+            for symbol in {channel.split(".", 1)[1] for channel in channels}:
+                market = markets.setdefault(symbol, StubMarket(DEFAULT_PRICE, args.volatility, args.drift))
+                price = market.step()
+                if f"bbo.{symbol}" in channels:
+                    await ws.send(_bbo_message(symbol, price))
+                if f"markets_summary.{symbol}" in channels:
+                    await ws.send(_summary_message(symbol, price))
+
+    publisher = asyncio.create_task(publish())
+    try:
+        async for raw in ws:
+            request = json.loads(raw)
+            if request.get("method") == "subscribe":
+                channel = request["params"]["channel"]
+                channels.add(channel)
+                await ws.send(json.dumps({
+                    "jsonrpc": "2.0",
+                    "id": request.get("id"),
+                    "result": {"channel": channel},
+                }))
+    finally:
+        publisher.cancel()
+
+
+async def serve(args) -> None:
+    markets = {}
+    for item in args.price:
+        symbol, price = item.split("=")
+        markets[symbol] = StubMarket(float(price), args.volatility, args.drift)
+
+    async with websockets.serve(lambda ws: _serve_client(ws, markets, args), args.host, args.port):
+        print(f"Paradex WebSocket stub listening on ws://{args.host}:{args.port}")
+        await asyncio.Future()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Paradex market data WebSocket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between ticks")
+    parser.add_argument("--volatility", type=float, default=0.001, help="Per-tick price stddev (fraction)")
+    parser.add_argument("--drift", type=float, default=0.0, help="Per-tick price drift (fraction)")
+    parser.add_argument("--price", action="append", default=[], help="Initial price, e.g. ETH-USD-PERP=2500")
+    asyncio.run(serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
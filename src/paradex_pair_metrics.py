@@ -1,7 +1,7 @@
-import requests
 import pandas as pd
 
-from src.config.constants import PARADEX_HTTP_URL, logger
+from src.config.constants import logger
+from src.paradex.prices import price_snapshot
 from src.config.paths import DATA_DIR
 from utils.general import _retry_request
 from src.paradex.market import update_markets
@@ -10,14 +10,7 @@ from src.paradex.market import update_markets
 def update_metrics():
     update_markets()
     
-    response = _retry_request(requests.get, f"{PARADEX_HTTP_URL}/markets/summary?market=ALL")
-
-    if response.status_code != 200:
-        logger.error(f"Failed to fetch market data: {response.status_code} - {response.text}")
-        raise ValueError("Failed to fetch market summary")
-
-    data = response.json()
-    results = data.get("results", [])
+    results = _retry_request(price_snapshot.fetch_summary)
 
     for item in results:
         greeks = item.pop("greeks", {})
@@ -1,29 +1,60 @@
 import random
+import threading
 import time
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Iterable, List, Dict, Any, Optional, Tuple
 import sys
-import os
 
 from starknet_py.net.account.account import Account
 
 from src.config.constants import logger
 from src.config.paths import DATA_DIR
-from src.paradex.auth import get_account
-from src.paradex.trade import open_position
+from src.paradex.auth import get_account, token_manager
+from src.paradex.registry import get_registry
+from src.paradex.models import Market, Order, Position
+from src.paradex.trade import place_order
 from src.paradex.account import get_open_positions
-from src.paradex.market import get_pair_data_by_symbol, get_pair_price
-from src.accounts_monitor import update_accounts_info
-from utils.data import update_state, get_user_state, USER_CONFIG
+from src.paradex.market import get_market_by_symbol, get_pair_price
+from src.paradex.ws_feed import MarketDataFeed
+from src.shard_workers import get_coordinator
+from src.account_snapshot import AccountRecord, AccountSnapshot
+from src.cycle_planner import CyclePlan, CyclePlanner, LegTemplate
+from src.accounts_monitor import BackgroundRefresher, latest_snapshot, refresh_dirty_accounts, update_accounts_info
+from utils.account_store import get_account_store, load_accounts
+from utils.data import update_state, update_many, get_user_state, USER_CONFIG
 from utils.calc import calc_value_distribution
+from utils.clock import Clock, get_clock
+from utils.ltv import TriggerBook
+from utils.margin import market_liquidation_prices
 from utils.general import _retry_request
+from utils.metrics import log_metrics
+from utils.retry import ORDER_RETRY_KINDS, RetryPolicy
+
+
+Leg = Tuple[Account, str, str, str]
+
+
+class LtvBreach(RuntimeError):
+    pass
 
 
 class TradingManager:
-    def __init__(self) -> None:
+    def __init__(self, pool: Optional[Collection[str]] = None, clock: Optional[Clock] = None) -> None:
         self.config: Dict[str, Any] = USER_CONFIG
         self.df_accounts: pd.DataFrame = pd.DataFrame({})
         self.retries = self.config["retries"]
+        self.retry_policy = RetryPolicy.for_orders()
+        self.balances: Dict[str, float] = {}
+        # Account ids this manager may trade, monitor and close; None means all.
+        self.pool = set(pool) if pool is not None else None
+        # Shard workers place orders and read positions when configured.
+        self.coordinator = get_coordinator()
+        self.clock = clock or get_clock()
+        self._planner: Optional[CyclePlanner] = None
+
+    def in_pool(self, account_id: str) -> bool:
+        return self.pool is None or account_id in self.pool
 
     def get_random_from_range(self, key: str) -> int:
         if key in self.config and isinstance(self.config[key], dict):
@@ -32,94 +63,157 @@ class TradingManager:
             return random.randint(min_val, max_val)
         raise ValueError(f"Invalid or missing config range for '{key}'")
     
-    def select_market_data(self, df_markets: pd.DataFrame) -> Dict[str, Any]:
+    def select_market(self, df_markets: pd.DataFrame) -> Market:
         max_attempts = len(df_markets)
         for attempt in range(max_attempts):
             random_idx = random.randint(0, len(df_markets) - 1)
             random_market = df_markets.iloc[random_idx]
             try:
-                pair_data = get_pair_data_by_symbol(random_market["symbol"])
-                if pair_data is not None:
-                    logger.info(f"Successfully selected market: {random_market['symbol']}")
-                    return pair_data
-                else:
-                    logger.warning(f"Market {random_market['symbol']} does not exist or data is unavailable")
+                market = get_market_by_symbol(random_market["symbol"])
+                logger.info(f"Successfully selected market: {market.symbol}")
+                return market
             except Exception as e:
                 logger.warning(f"Error selecting market {random_market['symbol']}: {str(e)}")
         logger.error("Failed to find an existing market after all attempts")
         raise ValueError("All markets are unavailable or do not exist")
 
     def start_trading(self) -> None:
-        while True:
-            df_markets = pd.read_excel(f"{DATA_DIR}/active_pairs.xlsx")
-            if df_markets.empty:
-                logger.warning("No markets found in active_pairs.xlsx. Stopping trading loop.")
-                break
-            
-            pair_data = self.select_market_data(df_markets)
-
-            accounts_per_trade = self.get_random_from_range("accounts_per_trade")
-            n_accounts_long = accounts_per_trade // 2
-            n_accounts_short = accounts_per_trade - n_accounts_long
-            order_value = self.get_random_from_range("order_value_usd")
-            order_duration = self.get_random_from_range("order_duration_min")
-
-            max_order_value = self.get_max_order_value()
-            order_value = min(order_value, max_order_value)
-
-            token = pair_data["base_currency"]
-            current_price = get_pair_price(token)
-
-            long_distr, short_distr = calc_value_distribution(
-                order_value * min(n_accounts_long, n_accounts_short),
-                n_accounts_long,
-                n_accounts_short,
-                pair_data["base_currency"],
-                current_price,
-                self.config["orders_distribution_noise"]
-            )
-
-            logger.info(
-                f"Starting trade | Market: {pair_data['symbol']} | "
-                f"Long accounts: {len(long_distr)} | Short accounts: {len(short_distr)} | "
-                f"Order: ${order_value} | Duration: {order_duration} min"
-            )
-
-            try:
-                self.open_positions(long_distr, short_distr, pair_data["symbol"])
-            except RuntimeError as e:
-                logger.error(f"Aborting trading session: {e}")
-                break
-
-            logger.info(f"All positions are opened. Waiting {order_duration} minutes before closing...")
-            logger.debug(f"Calling monitor_ltv with order_duration = {order_duration} (type: {type(order_duration)})")
-            self.monitor_ltv(order_duration)
-            self.close_all_positions()
-            delay_between_cycles = self.get_random_from_range("delay_between_trading_cycles_min")
-            logger.info(f"Waiting {delay_between_cycles} minutes before starting the next trading cycle...")
-            time.sleep(delay_between_cycles * 60)
+        refresh_config = self.config["accounts_refresh"]
+        refresher = BackgroundRefresher(
+            refresh_config["background_interval_sec"], refresh_config["background_batch_size"], self.clock
+        )
+        refresher.start()
+        try:
+            self._trading_loop()
+        finally:
+            refresher.stop()
+
+    def _trading_loop(self) -> None:
+        plan = self.plan_cycle()
+        lead_sec = self.config["planner"]["lead_min"] * 60
+
+        try:
+            while plan is not None:
+                try:
+                    self.execute_plan(plan)
+                except RuntimeError as e:
+                    logger.error(f"Aborting trading session: {e}")
+                    break
 
-    def get_max_order_value(self) -> float:
-        update_accounts_info()
+                self._planner = CyclePlanner(self.plan_cycle, self.clock)
+                self._planner.start(exclude=plan.account_ids, delay_sec=max(plan.order_duration * 60 - lead_sec, 0))
 
+                logger.info(f"All positions are opened. Waiting {plan.order_duration} minutes before closing...")
+                self.monitor_ltv(plan.order_duration)
+                self.close_all_positions()
+                refresh_dirty_accounts()
+                log_metrics()
+                delay_between_cycles = self.get_random_from_range("delay_between_trading_cycles_min")
+                logger.info(f"Waiting {delay_between_cycles} minutes before starting the next trading cycle...")
+                self.clock.sleep(delay_between_cycles * 60)
+
+                plan = self._next_plan()
+        finally:
+            self.cancel_planner()
+
+    def _next_plan(self) -> Optional[CyclePlan]:
+        planner, self._planner = self._planner, None
+        try:
+            return planner.result()
+        except Exception as e:
+            logger.warning(f"Planning the next cycle inline: {e}")
+            return self.plan_cycle()
+
+    def cancel_planner(self) -> None:
+        planner, self._planner = self._planner, None
+        if planner is None:
+            return
+        plan = planner.cancel()
+        if plan is not None:
+            self.discard_plan(plan)
+
+    def discard_plan(self, plan: CyclePlan) -> None:
+        logger.info(f"Dropped the next cycle plan on {plan.symbol}")
+
+    def plan_cycle(self, exclude: Iterable[str] = ()) -> Optional[CyclePlan]:
+        df_markets = pd.read_excel(f"{DATA_DIR}/active_pairs.xlsx")
+        if df_markets.empty:
+            logger.warning("No markets found in active_pairs.xlsx. Stopping trading loop.")
+            return None
+
+        market = self.select_market(df_markets)
+
+        accounts_per_trade = self.get_random_from_range("accounts_per_trade")
+        n_accounts_long = accounts_per_trade // 2
+        n_accounts_short = accounts_per_trade - n_accounts_long
+        order_value = self.get_random_from_range("order_value_usd")
+        order_duration = self.get_random_from_range("order_duration_min")
+
+        candidates = self.select_accounts(accounts_per_trade, exclude)
+        records = update_accounts_info(candidates).select(candidates)
+        order_value = min(order_value, self.get_max_order_value(records))
+
+        # Sides are assigned once the distribution is known, since it may
+        # trade fewer accounts on each side than planned here.
+        templates = [(get_account(record.address, record.private_key), record.proxy) for record in records]
+        self._warm_tokens(templates)
+
+        return CyclePlan(
+            market=market,
+            account_ids=candidates,
+            templates=templates,
+            balances={record.account_id: record.balance() for record in records},
+            n_long=n_accounts_long,
+            n_short=n_accounts_short,
+            order_value=order_value,
+            order_duration=order_duration,
+        )
+
+    def execute_plan(self, plan: CyclePlan) -> None:
+        current_price = get_pair_price(plan.token)
+
+        long_distr, short_distr = calc_value_distribution(
+            plan.order_value * min(plan.n_long, plan.n_short),
+            plan.n_long,
+            plan.n_short,
+            plan.token,
+            current_price,
+            self.config["orders_distribution_noise"]
+        )
+
+        logger.info(
+            f"Starting trade | Market: {plan.symbol} | "
+            f"Long accounts: {len(long_distr)} | Short accounts: {len(short_distr)} | "
+            f"Order: ${plan.order_value} | Duration: {plan.order_duration} min"
+        )
+
+        self.balances.update(plan.balances)
+        self.open_positions(long_distr, short_distr, plan.symbol, plan.templates)
+
+    def select_accounts(self, n_accounts: int, exclude: Iterable[str] = ()) -> List[str]:
+        # Accounts with orders since their last refresh may hold positions
+        # the snapshot has not seen yet.
+        excluded = set(exclude) | set(get_account_store().dirty())
+        available = [
+            record for record in latest_snapshot().active()
+            if record.position is None and record.account_id not in excluded and self.in_pool(record.account_id)
+        ]
+        if n_accounts > len(available):
+            raise ValueError(f"Not enough active accounts: need {n_accounts}, have {len(available)}")
+        return [record.account_id for record in random.sample(available, n_accounts)]
+
+    def get_max_order_value(self, records: List[AccountRecord]) -> float:
         max_order_value = float(self.config["order_value_usd"]["max"])
         max_account_leverage = float(self.config["max_leverage"])
 
-        self.df_accounts = pd.read_excel(f"{DATA_DIR}/accounts.xlsx")
         max_order_value_corrected = max_order_value
 
-        for x in range(self.df_accounts.shape[0]):
-            data = self.df_accounts.iloc[x]
-            short_pk = str(data["private_key"])[:10]
-
-            if not data.get("is_active", False):
-                continue
-
-            if data.get("position_market") and not pd.isnull(data["position_market"]):
-                logger.error(f"[{short_pk}] Position already opened: {data['position_market']}. Stopping code..")
+        for record in records:
+            if record.position is not None:
+                logger.error(f"[{record.short_pk}] Position already opened: {record.position.market}. Stopping code..")
                 raise ValueError("Opened positions are not allowed!")
 
-            usdc_balance = float(data.get("USDC", 0.0))
+            usdc_balance = record.balance()
             current_max_leverage = max_order_value / usdc_balance
 
             if current_max_leverage > max_account_leverage:
@@ -130,60 +224,165 @@ class TradingManager:
         logger.debug(f"Max order value after checks: {round(max_order_value_corrected, 2)} $")
         return max_order_value_corrected
 
-    def open_positions(self, long_dist: List[float], short_dist: List[float], market: str) -> None:
-        df_accounts = self.df_accounts[self.df_accounts["is_active"] == True]
-
-        n_long = len(long_dist)
-        n_short = len(short_dist)
-        n_total = n_long + n_short
-
-        if n_total > len(df_accounts):
-            raise ValueError(f"Not enough active accounts: need {n_total}, have {len(df_accounts)}")
-
-        df_shuffled = df_accounts.sample(frac=1).reset_index(drop=True).iloc[:n_total]
-        actions = ["long"] * n_long + ["short"] * n_short
+    def open_positions(
+        self,
+        long_dist: List[float],
+        short_dist: List[float],
+        market: str,
+        templates: List[LegTemplate],
+    ) -> None:
+        n_total = len(long_dist) + len(short_dist)
+        if n_total > len(templates):
+            raise ValueError(f"Not enough accounts: need {n_total}, have {len(templates)}")
+
+        actions = ["BUY"] * len(long_dist) + ["SELL"] * len(short_dist)
         random.shuffle(actions)
-
-        for i, action in enumerate(actions):
-            data = df_shuffled.iloc[i]
-            proxy = data["proxy"]
-            account = get_account(data["address"], data["private_key"])
-            pk = hex(account.signer.private_key)
-            side = "BUY" if action == "long" else "SELL"
-            size = str(long_dist.pop()) if action == "long" else str(short_dist.pop())
-
-            success = False
-            for attempt in range(1, self.retries + 1):
-                try:
-                    open_position(account, side, market, size, proxy)
-                    success = True
-                    break
-                except Exception as e:
-                    logger.warning(f"[{pk[:10]}] Attempt {attempt}/{self.retries} to open {side} position failed: {e}")
-                    time.sleep(1)
-
-            if not success:
+        legs: List[Leg] = [
+            (account, proxy, side, str(long_dist.pop() if side == "BUY" else short_dist.pop()))
+            for (account, proxy), side in zip(templates, actions)
+        ]
+
+        self._warm_tokens((account, proxy) for account, proxy, _, _ in legs)
+
+        mode = self.config["execution"]["mode"]
+        if mode == "sequential":
+            batches = [[leg] for leg in legs]
+        elif mode == "paired":
+            batches = self._pair_legs(legs)
+        else:
+            batches = [legs]
+
+        filled: List[Tuple[Leg, Order]] = []
+        for batch in batches:
+            fills = self._open_batch(batch, market)
+            batch_filled = [(leg, fill) for leg, fill in zip(batch, fills) if fill is not None]
+            # Record before anything else can fail, so a leg that cannot be
+            # unwound is still tracked as an open position.
+            self._record_legs(batch_filled, market)
+            filled.extend(batch_filled)
+
+            if None in fills:
+                pk = hex(batch[fills.index(None)][0].signer.private_key)
                 logger.error(f"[{pk[:10]}] All {self.retries} attempts to open position failed. Aborting.")
-                self.close_all_positions()
+                if not self._unwind_legs(filled, market):
+                    self.close_all_positions()
                 raise RuntimeError(f"[{pk[:10]}] Unable to open position after {self.retries} attempts.")
 
-            delay = self.get_random_from_range("delay_between_opening_orders_sec")
-            logger.info(f"Waiting {round(delay, 1)} sec..")
-            time.sleep(delay)
-
-            last_position = self.get_last_position_info(account, proxy)
+            if mode == "sequential":
+                delay = self.get_random_from_range("delay_between_opening_orders_sec")
+                logger.info(f"Waiting {round(delay, 1)} sec..")
+                self.clock.sleep(delay)
+
+    def _record_legs(self, filled: List[Tuple[Leg, Order]], market: str) -> None:
+        if len(filled) == 1:
+            self._record_leg(*filled[0], market)
+        elif filled:
+            with ThreadPoolExecutor(max_workers=len(filled)) as executor:
+                list(executor.map(lambda item: self._record_leg(*item, market), filled))
+
+    def _pair_legs(self, legs: List[Leg]) -> List[List[Leg]]:
+        longs = [leg for leg in legs if leg[2] == "BUY"]
+        shorts = [leg for leg in legs if leg[2] == "SELL"]
+
+        batches = [[long_leg, short_leg] for long_leg, short_leg in zip(longs, shorts)]
+        leftovers = longs[len(shorts):] + shorts[len(longs):]
+        if leftovers:
+            if batches:
+                batches[-1].extend(leftovers)
+            else:
+                batches.append(leftovers)
+        return batches
+
+    def _open_batch(self, batch: List[Leg], market: str) -> List[Optional[Order]]:
+        if len(batch) == 1:
+            fill, _ = self._open_leg(batch[0], market)
+            return [fill]
+
+        barrier = threading.Barrier(len(batch))
+        with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+            results = list(executor.map(lambda leg: self._open_leg(leg, market, barrier), batch))
+
+        submitted = [ts for _, ts in results]
+        skew_ms = (max(submitted) - min(submitted)) * 1000
+        max_skew_ms = self.config["execution"]["max_skew_ms"]
+        if skew_ms > max_skew_ms:
+            logger.warning(f"Leg submission skew {round(skew_ms)} ms exceeds target {max_skew_ms} ms")
+        else:
+            logger.debug(f"Leg submission skew: {round(skew_ms)} ms")
+
+        return [fill for fill, _ in results]
+
+    def _open_leg(
+        self, leg: Leg, market: str, barrier: Optional[threading.Barrier] = None
+    ) -> Tuple[Optional[Order], float]:
+        account, proxy, side, size = leg
+        pk = hex(account.signer.private_key)
+
+        if barrier is not None:
             try:
-                liquidation_price = last_position.get("liquidation_price", 0)
-            except:
-                liquidation_price = 0
-            update_state(pk, "position", "active")
-            update_state(pk, "order_side", side)
-            update_state(pk, "order_liq_price", liquidation_price)
+                barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass
+
+        submitted_at = time.time()
+        try:
+            fill = self._place_order(account, proxy, side, market, size, self.retry_policy)
+            return fill, submitted_at
+        except Exception as e:
+            logger.warning(f"[{pk[:10]}] Failed to open {side} position: {e}")
+            return None, submitted_at
+
+    def _record_leg(self, leg: Leg, fill: Order, market: str) -> None:
+        account, _, side, _ = leg
+        pk = hex(account.signer.private_key)
+        balance = self.balances.get(pk)
+        size = float(fill.filled_size) * (-1 if side == "SELL" else 1)
+
+        liquidation_price = None
+        if balance is None or balance <= 0:
+            logger.error(f"[{pk[:10]}] Balance unknown: LTV will rely on the exchange liquidation price")
+        else:
+            liquidation_price = float(market_liquidation_prices(
+                get_market_by_symbol(market), [balance], [size], [float(fill.avg_price)]
+            )[0])
+
+        update_many(pk, {
+            "position": "active",
+            "order_side": side,
+            "order_balance": balance,
+            "order_liq_price": liquidation_price,
+            "order_size": str(fill.filled_size),
+            "order_entry_price": str(fill.avg_price),
+        })
+
+    def _unwind_legs(self, filled: List[Tuple[Leg, Order]], market: str) -> bool:
+        if not filled:
+            return True
+
+        logger.warning(f"Unwinding {len(filled)} filled legs...")
+        unwind = [
+            (account, proxy, "SELL" if side == "BUY" else "BUY", str(fill.filled_size))
+            for (account, proxy, side, _), fill in filled
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(unwind)) as executor:
+            results = list(executor.map(lambda leg: self._open_leg(leg, market), unwind))
+
+        unwound = True
+        for (account, _, side, size), (fill, _) in zip(unwind, results):
+            pk = hex(account.signer.private_key)
+            if fill is not None:
+                update_state(pk, "position", "closed")
+                logger.info(f"[{pk[:10]}] Leg unwound: {side} {size} {market}")
+            else:
+                logger.error(f"[{pk[:10]}] Failed to unwind leg: {side} {size} {market}")
+                unwound = False
+        return unwound
 
     def close_all_positions(self) -> None:
         logger.info("Closing all open positions...")
 
-        self.df_accounts = pd.read_excel(f"{DATA_DIR}/accounts.xlsx")
+        self.df_accounts = load_accounts()
         df_active = self.df_accounts[self.df_accounts["is_active"] == True]
         df_active = df_active.sample(frac=1).reset_index(drop=True)
 
@@ -193,6 +392,8 @@ class TradingManager:
             account = get_account(data["address"], data["private_key"])
             proxy = data["proxy"]
             pk = hex(account.signer.private_key)
+            if not self.in_pool(pk):
+                continue
 
             pos = self.get_last_position_info(account, proxy)
 
@@ -200,20 +401,17 @@ class TradingManager:
                 logger.info(f"[{short_pk}] All positions closed for this account")
                 continue
 
-            market = pos["market"]
-            size = abs(float(pos["size"]))
-            side = pos["side"].upper()
-            close_side = "SELL" if side == "LONG" else "BUY"
+            market = pos.market
+            size = pos.abs_size
+            side = pos.side
+            close_side = pos.close_side
 
             success = False
-            for attempt in range(1, self.retries + 1):
-                try:
-                    open_position(account, close_side, market, str(size), proxy)
-                    success = True
-                    break
-                except Exception as e:
-                    logger.warning(f"[{short_pk}] Attempt {attempt}/{self.retries} to close {side} position failed: {e}")
-                    time.sleep(1)
+            try:
+                self._place_order(account, proxy, close_side, market, str(size), self.retry_policy)
+                success = True
+            except Exception as e:
+                logger.warning(f"[{short_pk}] Failed to close {side} position: {e}")
 
             if not success:
                 logger.error(f"[{short_pk}] Failed to close {side} position after {self.retries} attempts.")
@@ -222,75 +420,216 @@ class TradingManager:
             delay = self.get_random_from_range("delay_between_opening_orders_sec")
             logger.info(f"[{short_pk}] Waiting {delay} sec before next...")
             update_state(pk, "position", "closed")
-            time.sleep(delay)
-
-    def get_last_position_info(self, account: Account, proxy: str) -> Optional[Dict[str, Any]]:
-        position_data = _retry_request(get_open_positions, account, proxy)
-        results = position_data.get("results", [])
-
-        for pos in results:
-            status = pos.get("status", "").upper()
-            if status != "CLOSED":
-                return pos
-
-        return None
+            self.clock.sleep(delay)
+
+    def emergency_close_all_positions(self) -> None:
+        settings = self.config["emergency_close"]
+        registry = get_registry()
+        known = set(registry.ids(active_only=False))
+        targets = [
+            (registry.get(pk), registry.entry(pk).proxy)
+            for pk, data in self._pool_state().items()
+            if data.get("position") == "active" and pk in known
+        ]
+        logger.warning(f"Emergency close: flattening {len(targets)} accounts with open positions in parallel...")
+
+        started_at = time.time()
+        latencies: Dict[str, float] = {}
+        remaining = targets
+        workers = max(min(len(targets), settings["max_workers"]), 1)
+
+        for sweep in range(1, settings["sweep_rounds"] + 1):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda target: self._emergency_close(*target), remaining))
+
+                for (account, _), closed_at in zip(remaining, results):
+                    pk = hex(account.signer.private_key)
+                    if closed_at is not None and pk not in latencies:
+                        latencies[pk] = closed_at - started_at
+
+                still_open = list(executor.map(lambda target: self._still_open(*target), remaining))
+            remaining = [target for target, is_open in zip(remaining, still_open) if is_open]
+
+            if not remaining:
+                break
+            logger.warning(f"Emergency close sweep {sweep}: {len(remaining)} accounts still open")
+
+        for pk, latency in sorted(latencies.items(), key=lambda item: item[1]):
+            logger.info(f"[{pk[:10]}] Closed in {round(latency * 1000)} ms")
+
+        for account, _ in remaining:
+            logger.error(f"[{hex(account.signer.private_key)[:10]}] Position is still open after emergency close!")
+
+        logger.info(f"Emergency close finished in {round(time.time() - started_at, 2)} sec")
+
+    def _emergency_close(self, account: Account, proxy: str) -> Optional[float]:
+        settings = self.config["emergency_close"]
+        pk = hex(account.signer.private_key)
+
+        pos = self._safe_position_info(account, proxy)
+        if not pos:
+            return None
+
+        market = pos.market
+        size = pos.abs_size
+        close_side = pos.close_side
+
+        policy = RetryPolicy(
+            retries=settings["retries"],
+            base_delay_sec=settings["retry_delay_sec"],
+            max_delay_sec=settings["retry_delay_sec"] * 4,
+            retry_kinds=ORDER_RETRY_KINDS,
+        )
+        try:
+            self._place_order(account, proxy, close_side, market, str(size), policy, breaker=False)
+        except Exception as e:
+            logger.warning(f"[{pk[:10]}] Emergency close failed: {e}")
+            return None
+
+        update_state(pk, "position", "closed")
+        return time.time()
+
+    def _safe_position_info(self, account: Account, proxy: str) -> Optional[Position]:
+        try:
+            return self.get_last_position_info(account, proxy)
+        except Exception as e:
+            logger.warning(f"[{hex(account.signer.private_key)[:10]}] Failed to fetch position: {e}")
+            return None
+
+    def _still_open(self, account: Account, proxy: str) -> bool:
+        try:
+            return self.get_last_position_info(account, proxy) is not None
+        except Exception as e:
+            logger.warning(f"[{hex(account.signer.private_key)[:10]}] Failed to fetch position: {e}")
+            return True
+
+    def get_last_position_info(self, account: Account, proxy: str) -> Optional[Position]:
+        if self.coordinator is not None:
+            pk = hex(account.signer.private_key)
+            positions = self.coordinator.positions([pk])[pk]
+        else:
+            positions = _retry_request(get_open_positions, account, proxy)
+        return next((position for position in positions if position.is_open), None)
 
     def monitor_ltv(self, duration_min: int) -> None:
         logger.info("Starting LTV monitoring...")
         logger.debug(f"[monitor_ltv] duration_min argument = {duration_min} (type: {type(duration_min)})")
 
-        end_time = time.time() + duration_min * 60
+        end_time = self.clock.time() + duration_min * 60
         logger.debug(f"monitor_ltv will end at {end_time} ({duration_min} min from now)")
 
-        while time.time() < end_time:
-            try:
-                state: Dict[str, Dict[str, Any]] = get_user_state()
-
-                for pk, info in state.items():
-                    if info.get("position") != "active":
-                        continue
+        if self.config["market_data"]["source"] == "ws":
+            self._monitor_ltv_ws(end_time)
+        else:
+            self._monitor_ltv_rest(end_time)
 
-                    side = info.get("order_side", "").upper()
-                    liq_price = info.get("order_liq_price", 0.0)
-                    last_order = info.get("last_order", {})
-                    market = last_order.get("market", "")
+        logger.info("LTV monitoring finished — duration elapsed.")
 
-                    if not market or "-" not in market:
-                        continue
+    def _monitor_ltv_rest(self, end_time: float) -> None:
+        book, source = self._trigger_book()
 
-                    base_token = market.split("-")[0]
-                    current_price = get_pair_price(base_token)
+        while self.clock.time() < end_time:
+            try:
+                if latest_snapshot() is not source:
+                    book, source = self._trigger_book()
+                for market in book.markets():
+                    self._check_market_ltv(book, market, get_pair_price(market.split("-")[0]))
 
-                    if isinstance(liq_price, str):
-                        liq_price = float(liq_price) if liq_price.strip() else 0.0
+            except LtvBreach:
+                raise
+            except Exception as e:
+                logger.warning(f"Error monitoring liquidity: {e}. The process continues")
 
-                    if liq_price == 0 or current_price == 0:
-                        logger.debug(f"[{pk[:10]}] Skipping LTV calc: liq={liq_price}, current={current_price}")
-                        continue
+            wait_time = self.get_random_from_range("ltv_checks_sec")
+            logger.debug(f"Next LTV check in {round(wait_time, 0)} seconds...")
+            self.clock.sleep(wait_time)
 
-                    if side == "SELL":
-                        ltv = current_price / liq_price
-                    elif side == "BUY":
-                        ltv = liq_price / current_price
-                    else:
-                        continue
+    def _monitor_ltv_ws(self, end_time: float) -> None:
+        market_data = self.config["market_data"]
+        book, source = self._trigger_book()
 
-                    ltv *= 100
-                    ltv_rounded = round(ltv, 1)
+        feed = MarketDataFeed(market_data["ws_url"])
+        feed.start(book.markets())
 
-                    logger.debug(f"[{pk[:10]}] LTV = {ltv_rounded}% | Side: {side} | Market: {market}")
+        try:
+            while self.clock.time() < end_time:
+                timeout = min(market_data["stale_after_sec"], max(0.0, end_time - self.clock.time()))
+                updated = feed.next_updates(timeout)
 
-                    if ltv > self.config["max_position_ltv"]:
-                        logger.info(f"[{pk[:10]}] LTV = {ltv_rounded}% | Side: {side} | Market: {market}")
-                        logger.warning(f"[{pk[:10]}] Max LTV exceeded — closing all positions.")
-                        self.close_all_positions()
-                        os._exit(0)
+                try:
+                    if latest_snapshot() is not source:
+                        book, source = self._trigger_book()
 
-            except Exception as e:
-                logger.warning(f"Error monitoring liquidity: {e}. The process continues")
+                    if not updated and self.clock.time() < end_time:
+                        logger.warning(f"No market data for {timeout} sec. Checking LTV via REST")
+                        for market in book.markets():
+                            self._check_market_ltv(book, market, get_pair_price(market.split("-")[0]))
+                        continue
 
-            wait_time = self.get_random_from_range("ltv_checks_sec")
-            logger.debug(f"Next LTV check in {round(wait_time, 0)} seconds...")
-            time.sleep(wait_time)
+                    for market in updated:
+                        tick = feed.prices.get(market)
+                        if tick is not None:
+                            self._check_market_ltv(book, market, tick.price)
 
-        logger.info("LTV monitoring finished — duration elapsed.")
+                except LtvBreach:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Error monitoring liquidity: {e}. The process continues")
+        finally:
+            feed.stop()
+
+    def _trigger_book(self) -> Tuple[TriggerBook, AccountSnapshot]:
+        # Rebuilt whenever the refresher publishes a new snapshot, so the
+        # model follows current balances rather than the ones at entry.
+        snapshot = latest_snapshot()
+        state = self._pool_state()
+        records = snapshot.select(pk for pk, data in state.items() if data.get("position") == "active")
+        balances = {record.account_id: record.balance() for record in records if record.balance() > 0}
+        exchange_liq_prices = {
+            record.account_id: record.position.liq_price
+            for record in records if record.position is not None and record.position.liq_price > 0
+        }
+        book = TriggerBook.from_state(state, self.config["max_position_ltv"], balances, exchange_liq_prices)
+        return book, snapshot
+
+    def _pool_state(self) -> Dict[str, Any]:
+        state = get_user_state()
+        if self.pool is None:
+            return state
+        return {pk: data for pk, data in state.items() if pk in self.pool}
+
+    def _check_market_ltv(self, book: TriggerBook, market: str, current_price: float) -> None:
+        breached = book.check(market, current_price)
+        if not breached:
+            logger.debug(f"LTV OK | Market: {market} | Price: {current_price}")
+            return
+
+        for pk, side, liq_price, ltv in breached:
+            logger.info(f"[{pk[:10]}] LTV = {round(ltv, 1)}% | Side: {side} | Market: {market}")
+
+        logger.warning(f"[{breached[0][0][:10]}] Max LTV exceeded — closing all positions.")
+        self.emergency_close_all_positions()
+        raise LtvBreach(f"Max LTV exceeded on {market}")
+
+    def _place_order(
+        self,
+        account: Account,
+        proxy: str,
+        side: str,
+        market: str,
+        size: str,
+        policy: RetryPolicy,
+        breaker: bool = True,
+    ) -> Order:
+        pk = hex(account.signer.private_key)
+        if self.coordinator is not None:
+            return self.coordinator.open_position(pk, side, market, size, policy, breaker)
+        return place_order(
+            account, side, market, size, proxy, policy, breaker_key=f"account:{pk}" if breaker else None
+        )
+
+    def _warm_tokens(self, accounts: Iterable[Tuple[Account, str]]) -> None:
+        if self.coordinator is not None:
+            self.coordinator.warm(hex(account.signer.private_key) for account, _ in accounts)
+        else:
+            token_manager.warm(accounts)
@@ -0,0 +1,199 @@
+import random
+import threading
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from src.config.constants import logger
+from src.accounts_monitor import BackgroundRefresher
+from src.cycle_planner import CyclePlan
+from src.paradex.models import Market
+from src.paradex.registry import get_registry
+from src.position_manager import LtvBreach, TradingManager
+from utils.clock import Clock, get_clock
+from utils.data import USER_CONFIG
+
+
+class NotionalBudget:
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.used = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, requested: float, minimum: float) -> float:
+        if minimum > self.limit:
+            raise ValueError(f"Cycle needs ${round(minimum, 2)} of notional, cap is ${self.limit}")
+
+        with self._cond:
+            if self.limit - self.used < minimum:
+                logger.info(f"Open notional cap reached (${round(self.used, 2)} of ${self.limit}). Waiting...")
+            while self.limit - self.used < minimum:
+                self._cond.wait()
+
+            granted = min(requested, self.limit - self.used)
+            self.used += granted
+            return granted
+
+    def release(self, amount: float) -> None:
+        with self._cond:
+            self.used = max(self.used - amount, 0.0)
+            self._cond.notify_all()
+
+
+class TradingSession(TradingManager):
+    def __init__(self, name: str, pool: Collection[str], scheduler: "SessionScheduler") -> None:
+        super().__init__(pool, scheduler.clock)
+        self.name = name
+        self.scheduler = scheduler
+        self._cycle: Optional[CyclePlan] = None
+        self._planning: Optional[str] = None
+        self._reserved = 0.0
+
+    def select_market(self, df_markets: pd.DataFrame) -> Market:
+        while True:
+            taken = self.scheduler.markets_taken(exclude_session=self.name)
+            df_free = df_markets[~df_markets["symbol"].isin(taken)]
+            if df_free.empty:
+                raise ValueError(f"[{self.name}] No market left that other sessions are not trading")
+
+            market = super().select_market(df_free.reset_index(drop=True))
+            if self.scheduler.claim_market(market.symbol, self.name):
+                self._planning = market.symbol
+                return market
+
+    def plan_cycle(self, exclude: Iterable[str] = ()) -> Optional[CyclePlan]:
+        # At most one plan is in flight per session, so a single slot is
+        # enough to drop the claim of a plan that failed half way.
+        self._planning = None
+        try:
+            return super().plan_cycle(exclude)
+        except Exception:
+            if self._planning is not None:
+                self.scheduler.release_market(self._planning, self.name)
+            raise
+
+    def discard_plan(self, plan: CyclePlan) -> None:
+        self.scheduler.release_market(plan.symbol, self.name)
+        logger.info(f"[{self.name}] Dropped the next cycle plan on {plan.symbol}")
+
+    def execute_plan(self, plan: CyclePlan) -> None:
+        legs = min(plan.n_long, plan.n_short)
+        requested = 2 * plan.order_value * legs
+        minimum = min(2 * float(self.config["order_value_usd"]["min"]) * legs, requested)
+
+        self._reserved = self.scheduler.budget.acquire(requested, minimum)
+        if legs and self._reserved < requested:
+            plan.order_value = self._reserved / (2 * legs)
+            logger.info(f"[{self.name}] Order value cut to ${round(plan.order_value, 2)} by the notional cap")
+
+        self._cycle = plan
+        try:
+            super().execute_plan(plan)
+        except Exception:
+            self._finish_cycle()
+            raise
+
+    def close_all_positions(self) -> None:
+        super().close_all_positions()
+        self._finish_cycle()
+
+    def run(self) -> None:
+        logger.info(f"[{self.name}] Session started with {len(self.pool)} accounts")
+        try:
+            self._trading_loop()
+        except LtvBreach as e:
+            logger.error(f"[{self.name}] Session stopped: {e}")
+        except Exception as e:
+            logger.error(f"[{self.name}] Session failed: {e}. Closing its positions...")
+            try:
+                self.close_all_positions()
+            except Exception as close_error:
+                logger.error(f"[{self.name}] Failed to close session positions: {close_error}")
+        finally:
+            self._finish_cycle()
+            self.scheduler.release_session(self.name)
+            logger.info(f"[{self.name}] Session finished")
+
+    def _finish_cycle(self) -> None:
+        if self._reserved:
+            self.scheduler.budget.release(self._reserved)
+            self._reserved = 0.0
+        if self._cycle is not None:
+            self.scheduler.release_market(self._cycle.symbol, self.name)
+            self._cycle = None
+
+
+class SessionScheduler:
+    def __init__(self, count: int, max_total_notional: float, clock: Optional[Clock] = None) -> None:
+        self.count = count
+        self.clock = clock or get_clock()
+        self.budget = NotionalBudget(max_total_notional)
+        # symbol -> (owning session, claims held by that session)
+        self._markets: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "SessionScheduler":
+        sessions = USER_CONFIG["sessions"]
+        return cls(sessions["count"], float(sessions["max_total_notional_usd"]))
+
+    def partition(self) -> List[List[str]]:
+        account_ids = get_registry().ids()
+        random.shuffle(account_ids)
+        pools = [account_ids[i::self.count] for i in range(self.count)]
+
+        needed = USER_CONFIG["accounts_per_trade"]["max"]
+        if min(len(pool) for pool in pools) < needed:
+            raise ValueError(
+                f"{len(account_ids)} active accounts can't fill {self.count} sessions of {needed} accounts"
+            )
+        return pools
+
+    def markets_taken(self, exclude_session: str = "") -> List[str]:
+        with self._lock:
+            return [symbol for symbol, (owner, _) in self._markets.items() if owner != exclude_session]
+
+    def claim_market(self, symbol: str, session: str) -> bool:
+        with self._lock:
+            owner, claims = self._markets.get(symbol, (session, 0))
+            if owner != session:
+                return False
+            self._markets[symbol] = (session, claims + 1)
+            return True
+
+    def release_market(self, symbol: str, session: str) -> None:
+        with self._lock:
+            owner, claims = self._markets.get(symbol, (None, 0))
+            if owner != session:
+                return
+            if claims > 1:
+                self._markets[symbol] = (session, claims - 1)
+            else:
+                del self._markets[symbol]
+
+    def release_session(self, session: str) -> None:
+        with self._lock:
+            for symbol in [symbol for symbol, (owner, _) in self._markets.items() if owner == session]:
+                del self._markets[symbol]
+
+    def run(self) -> None:
+        sessions = [
+            TradingSession(f"session-{i + 1}", pool, self)
+            for i, pool in enumerate(self.partition())
+        ]
+        logger.info(f"Starting {len(sessions)} trading sessions | Notional cap: ${self.budget.limit}")
+
+        refresh_config = USER_CONFIG["accounts_refresh"]
+        refresher = BackgroundRefresher(
+            refresh_config["background_interval_sec"], refresh_config["background_batch_size"], self.clock
+        )
+        refresher.start()
+
+        threads = [threading.Thread(target=session.run, name=session.name) for session in sessions]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            refresher.stop()
@@ -0,0 +1,230 @@
+import asyncio
+import atexit
+import itertools
+import multiprocessing as mp
+import queue
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.config.constants import logger
+from src.paradex.account import get_open_positions
+from src.paradex.async_client import AccountState, fetch_accounts
+from src.paradex.auth import token_manager
+from src.paradex.client import close_sessions, proxy_key
+from src.paradex.models import Order, Position
+from src.paradex.registry import get_registry
+from src.paradex.trade import place_order
+from utils.data import USER_CONFIG
+from utils.general import _retry_request
+from utils.retry import (
+    CircuitOpenError,
+    OrderRejectedError,
+    OrderSubmittedError,
+    ParadexAPIError,
+    RemoteError,
+    RetryPolicy,
+    classify_error,
+)
+
+# Exceptions that pickle with their attributes; anything else crosses the
+# process boundary as a RemoteError carrying its kind.
+PICKLABLE_ERRORS = (ParadexAPIError, CircuitOpenError, OrderSubmittedError, OrderRejectedError, RemoteError)
+
+
+def shard_of(proxy_str: Optional[str], shards: int) -> int:
+    # Rate limits and breakers are kept per proxy, so every account behind a
+    # proxy must land in the process that owns its buckets.
+    return zlib.crc32(proxy_key(proxy_str).encode()) % shards
+
+
+def _open(account_id: str, side: str, market: str, size: str, policy: RetryPolicy, breaker: bool) -> Order:
+    registry = get_registry()
+    return place_order(
+        registry.get(account_id), side, market, size, registry.entry(account_id).proxy, policy,
+        breaker_key=f"account:{account_id}" if breaker else None,
+    )
+
+
+def _positions(account_ids: List[str]) -> Dict[str, List[Position]]:
+    registry = get_registry()
+    return {
+        account_id: _retry_request(get_open_positions, registry.get(account_id), registry.entry(account_id).proxy)
+        for account_id in account_ids
+    }
+
+
+def _refresh(account_ids: List[str]) -> Dict[str, AccountState]:
+    registry = get_registry()
+    targets = [(account_id, registry.get(account_id), registry.entry(account_id).proxy) for account_id in account_ids]
+    return asyncio.run(fetch_accounts(targets, USER_CONFIG["accounts_refresh"]))
+
+
+def _warm(account_ids: List[str]) -> None:
+    registry = get_registry()
+    token_manager.warm((registry.get(account_id), registry.entry(account_id).proxy) for account_id in account_ids)
+
+
+HANDLERS = {"open": _open, "positions": _positions, "refresh": _refresh, "warm": _warm}
+
+
+def _handle(responses: mp.Queue, request_id: int, op: str, payload: Tuple[Any, ...]) -> None:
+    try:
+        responses.put((request_id, True, HANDLERS[op](*payload)))
+    except Exception as e:
+        if not isinstance(e, PICKLABLE_ERRORS):
+            e = RemoteError(classify_error(e), f"{type(e).__name__}: {e}")
+        responses.put((request_id, False, e))
+
+
+def _worker_main(shard: int, threads: int, requests: mp.Queue, responses: mp.Queue) -> None:
+    logger.info(f"Shard worker {shard} started")
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix=f"shard-{shard}") as executor:
+        while True:
+            message = requests.get()
+            if message is None:
+                break
+            executor.submit(_handle, responses, *message)
+    close_sessions()
+    logger.info(f"Shard worker {shard} stopped")
+
+
+class ShardCoordinator:
+    def __init__(self, processes: int, threads: int) -> None:
+        self.processes = processes
+        self.threads = threads
+        self._context = mp.get_context("spawn")
+        self._requests: List[mp.Queue] = []
+        self._responses: Optional[mp.Queue] = None
+        self._workers: List[mp.Process] = []
+        self._pending: Dict[int, Tuple[int, Future]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._responses = self._context.Queue()
+        for shard in range(self.processes):
+            requests = self._context.Queue()
+            worker = self._context.Process(
+                target=_worker_main, args=(shard, self.threads, requests, self._responses),
+                name=f"shard-{shard}", daemon=True,
+            )
+            worker.start()
+            self._requests.append(requests)
+            self._workers.append(worker)
+
+        self._reader = threading.Thread(target=self._read, name="shard-responses", daemon=True)
+        self._reader.start()
+        logger.info(f"Started {self.processes} shard workers")
+
+    def shard_of(self, account_id: str) -> int:
+        return shard_of(get_registry().entry(account_id).proxy, self.processes)
+
+    def submit(self, shard: int, op: str, *payload: Any) -> Future:
+        future: Future = Future()
+        if not self._workers[shard].is_alive():
+            future.set_exception(RuntimeError(f"Shard worker {shard} is not running"))
+            return future
+
+        request_id = next(self._ids)
+        with self._lock:
+            self._pending[request_id] = (shard, future)
+        self._requests[shard].put((request_id, op, payload))
+        return future
+
+    def open_position(
+        self,
+        account_id: str,
+        side: str,
+        market: str,
+        size: str,
+        policy: RetryPolicy,
+        breaker: bool = True,
+    ) -> Order:
+        return self.submit(self.shard_of(account_id), "open", account_id, side, market, size, policy, breaker).result()
+
+    def positions(self, account_ids: Iterable[str]) -> Dict[str, List[Position]]:
+        return self._scatter("positions", account_ids)
+
+    def refresh(self, account_ids: Iterable[str]) -> Dict[str, AccountState]:
+        return self._scatter("refresh", account_ids)
+
+    def warm(self, account_ids: Iterable[str]) -> None:
+        for shard, shard_ids in self._group(account_ids).items():
+            self.submit(shard, "warm", shard_ids)
+
+    def shutdown(self) -> None:
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        for requests in self._requests:
+            requests.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._fail_pending(lambda shard: True, "Shard coordinator stopped")
+
+    def _scatter(self, op: str, account_ids: Iterable[str]) -> Dict[str, Any]:
+        futures = [self.submit(shard, op, shard_ids) for shard, shard_ids in self._group(account_ids).items()]
+        merged: Dict[str, Any] = {}
+        for future in futures:
+            merged.update(future.result())
+        return merged
+
+    def _group(self, account_ids: Iterable[str]) -> Dict[int, List[str]]:
+        groups: Dict[int, List[str]] = {}
+        for account_id in account_ids:
+            groups.setdefault(self.shard_of(account_id), []).append(account_id)
+        return groups
+
+    def _read(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                request_id, ok, result = self._responses.get(timeout=1)
+            except queue.Empty:
+                dead = {shard for shard, worker in enumerate(self._workers) if not worker.is_alive()}
+                if dead:
+                    self._fail_pending(lambda shard: shard in dead, "Shard worker exited")
+                continue
+
+            with self._lock:
+                _, future = self._pending.pop(request_id, (None, None))
+            if future is None:
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+
+    def _fail_pending(self, match, reason: str) -> None:
+        with self._lock:
+            failed = [request_id for request_id, (shard, _) in self._pending.items() if match(shard)]
+            futures = [self._pending.pop(request_id)[1] for request_id in failed]
+        for future in futures:
+            future.set_exception(RuntimeError(reason))
+        if futures:
+            logger.error(f"{reason}: {len(futures)} requests failed")
+
+
+_coordinator: Optional[ShardCoordinator] = None
+_coordinator_lock = threading.Lock()
+
+
+def get_coordinator() -> Optional[ShardCoordinator]:
+    global _coordinator
+    settings = USER_CONFIG.get("workers", {})
+    if settings.get("processes", 0) <= 0:
+        return None
+
+    if _coordinator is None:
+        with _coordinator_lock:
+            if _coordinator is None:
+                coordinator = ShardCoordinator(settings["processes"], settings["threads"])
+                coordinator.start()
+                atexit.register(coordinator.shutdown)
+                _coordinator = coordinator
+    return _coordinator
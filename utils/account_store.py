@@ -0,0 +1,263 @@
+import atexit
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.config.constants import logger
+from src.config.paths import ACCOUNTS_DB_PATH, ACCOUNTS_PATH
+
+IDENTITY_COLUMNS = [
+    ("private_key", "TEXT PRIMARY KEY"),
+    ("address", "TEXT NOT NULL"),
+    ("proxy", "TEXT"),
+    ("is_active", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+POSITION_COLUMNS = [
+    ("position_market", "TEXT"),
+    ("position_side", "TEXT"),
+    ("position_size", "REAL"),
+    ("position_avg_price", "REAL"),
+    ("position_mark_price", "REAL"),
+    ("position_liq_price", "REAL"),
+    ("position_pnl", "REAL"),
+    ("position_ltv", "REAL"),
+]
+
+ACCOUNT_COLUMNS = [name for name, _ in IDENTITY_COLUMNS + POSITION_COLUMNS]
+BASE_TOKEN = "USDC"
+
+
+def _value(value: Any) -> Any:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
+
+
+class AccountStore:
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._init_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connection()
+        columns = ", ".join(f"{name} {kind}" for name, kind in IDENTITY_COLUMNS + POSITION_COLUMNS)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS accounts ({columns})")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS balances ("
+            "private_key TEXT NOT NULL, "
+            "token TEXT NOT NULL, "
+            "size REAL NOT NULL, "
+            "PRIMARY KEY (private_key, token))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS refresh ("
+            "account_id TEXT PRIMARY KEY, "
+            "touched_at REAL, "
+            "refreshed_at REAL)"
+        )
+
+    def is_empty(self) -> bool:
+        return self._connection().execute("SELECT 1 FROM accounts LIMIT 1").fetchone() is None
+
+    def import_xlsx(self, path: str) -> int:
+        df = pd.read_excel(path)
+
+        missing = [name for name, _ in IDENTITY_COLUMNS if name not in df.columns]
+        if missing:
+            raise ValueError(f"Missing columns in {path}: {missing}")
+
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM accounts")
+            conn.execute("DELETE FROM balances")
+            conn.execute("DELETE FROM refresh")
+            self._write(conn, df)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        logger.success(f"Imported {df.shape[0]} accounts from {path}")
+        return df.shape[0]
+
+    def upsert(self, df: pd.DataFrame) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write(conn, df)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _write(self, conn: sqlite3.Connection, df: pd.DataFrame) -> None:
+        columns = [name for name in ACCOUNT_COLUMNS if name in df.columns]
+        tokens = [name for name in df.columns if name not in ACCOUNT_COLUMNS]
+
+        updates = ", ".join(f"{name} = excluded.{name}" for name in columns if name != "private_key")
+        conn.executemany(
+            f"INSERT INTO accounts ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(private_key) DO UPDATE SET {updates}",
+            [self._account_row(row, columns) for row in df[columns].itertuples(index=False)],
+        )
+
+        if not tokens:
+            return
+
+        keys = [(str(pk),) for pk in df["private_key"]]
+        conn.executemany("DELETE FROM balances WHERE private_key = ?", keys)
+        conn.executemany(
+            "INSERT INTO balances (private_key, token, size) VALUES (?, ?, ?)",
+            [
+                (str(pk), token, float(size))
+                for pk, *sizes in df[["private_key"] + tokens].itertuples(index=False)
+                for token, size in zip(tokens, sizes)
+                if _value(size) is not None
+            ],
+        )
+
+    def _account_row(self, row: Iterable[Any], columns: List[str]) -> List[Any]:
+        values = []
+        for name, value in zip(columns, row):
+            value = _value(value)
+            if name == "is_active":
+                value = int(value is True or value == 1)
+            elif name in ("private_key", "address") and value is not None:
+                value = str(value)
+            values.append(value)
+        return values
+
+    def mark_touched(self, account_ids: Iterable[str], at: Optional[float] = None) -> None:
+        at = time.time() if at is None else at
+        self._connection().executemany(
+            "INSERT INTO refresh (account_id, touched_at) VALUES (?, ?) "
+            "ON CONFLICT(account_id) DO UPDATE SET touched_at = excluded.touched_at",
+            [(account_id, at) for account_id in account_ids],
+        )
+
+    def mark_refreshed(self, account_ids: Iterable[str], at: float) -> None:
+        self._connection().executemany(
+            "INSERT INTO refresh (account_id, refreshed_at) VALUES (?, ?) "
+            "ON CONFLICT(account_id) DO UPDATE SET refreshed_at = excluded.refreshed_at",
+            [(account_id, at) for account_id in account_ids],
+        )
+
+    def dirty(self) -> List[str]:
+        rows = self._connection().execute(
+            "SELECT account_id FROM refresh "
+            "WHERE touched_at IS NOT NULL AND (refreshed_at IS NULL OR touched_at >= refreshed_at)"
+        )
+        return [account_id for account_id, in rows]
+
+    def refreshed_at(self) -> Dict[str, float]:
+        rows = self._connection().execute(
+            "SELECT account_id, refreshed_at FROM refresh WHERE refreshed_at IS NOT NULL"
+        )
+        return dict(rows.fetchall())
+
+    def load(self, active_only: bool = False) -> pd.DataFrame:
+        conn = self._connection()
+        query = f"SELECT {', '.join(ACCOUNT_COLUMNS)} FROM accounts"
+        if active_only:
+            query += " WHERE is_active = 1"
+        accounts = pd.read_sql_query(query + " ORDER BY rowid", conn)
+        balances = pd.read_sql_query("SELECT private_key, token, size FROM balances", conn)
+
+        tokens = balances.pivot(index="private_key", columns="token", values="size")
+        if BASE_TOKEN not in tokens.columns:
+            tokens[BASE_TOKEN] = None
+        token_columns = [BASE_TOKEN] + sorted(name for name in tokens.columns if name != BASE_TOKEN)
+
+        df = accounts.merge(tokens[token_columns], left_on="private_key", right_index=True, how="left")
+        df["is_active"] = pd.Series([value == 1 for value in df["is_active"]], index=df.index, dtype=object)
+
+        identity = [name for name, _ in IDENTITY_COLUMNS]
+        positions = [name for name, _ in POSITION_COLUMNS]
+        return df[identity + token_columns + positions]
+
+    def export_xlsx(self, path: str) -> None:
+        self.load().to_excel(path, index=False)
+
+
+class ExcelExporter:
+    def __init__(self, store: AccountStore, path: str, delay_sec: float = 2.0) -> None:
+        self.store = store
+        self.path = path
+        self.delay_sec = delay_sec
+        self._pending = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self) -> None:
+        self._pending.set()
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="accounts-export", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+    def flush(self) -> None:
+        if not self._pending.is_set():
+            return
+        with self._lock:
+            if not self._pending.is_set():
+                return
+            self._pending.clear()
+            try:
+                self.store.export_xlsx(self.path)
+            except Exception as e:
+                logger.warning(f"Failed to export accounts to {self.path}: {e}")
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            # Coalesce bursts of updates into one export.
+            time.sleep(self.delay_sec)
+            self.flush()
+
+
+_store: Optional[AccountStore] = None
+_exporter: Optional[ExcelExporter] = None
+_store_lock = threading.Lock()
+
+
+def get_account_store() -> AccountStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AccountStore(ACCOUNTS_DB_PATH)
+    return _store
+
+
+def get_account_exporter() -> ExcelExporter:
+    global _exporter
+    if _exporter is None:
+        with _store_lock:
+            if _exporter is None:
+                _exporter = ExcelExporter(get_account_store(), ACCOUNTS_PATH)
+    return _exporter
+
+
+def load_accounts(active_only: bool = False) -> pd.DataFrame:
+    store = get_account_store()
+    if store.is_empty():
+        raise RuntimeError("Account store is empty. Import data/accounts.xlsx from the main menu first.")
+    return store.load(active_only)
@@ -3,7 +3,7 @@ import random
 from decimal import Decimal, getcontext
 
 from src.config.constants import logger
-from src.paradex.market import get_pair_data
+from src.paradex.market import get_market
 from utils.data import USER_CONFIG
 
 getcontext().prec = 32
@@ -17,9 +17,9 @@ def calc_value_distribution(
     current_price: float,
     noise: float
 ) -> tuple:
-    pair_data = get_pair_data(token)
-    min_notional = int(pair_data["min_notional"])
-    precision = Decimal(str(pair_data["order_size_increment"]))
+    market = get_market(token)
+    min_notional = int(market.min_notional)
+    precision = market.order_size_increment
     min_token_amount = calc_min_token_amount(min_notional, current_price, precision)
 
     max_token_amount = resize_amount(
@@ -3,7 +3,7 @@ import random
 from decimal import Decimal, getcontext
 
 from src.config.constants import logger
-from src.paradex.market import get_pair_data
+from src.paradex.market import get_market
 from utils.data import USER_CONFIG
 
 getcontext().prec = 32
@@ -17,9 +17,9 @@ def calc_value_distribution(
     current_price: float,
     noise: float
 ) -> tuple:
-    pair_data = get_pair_data(token)
-    min_notional = int(pair_data["min_notional"])
-    precision = Decimal(str(pair_data["order_size_increment"]))
+    market = get_market(token)
+    min_notional = int(market.min_notional)
+    precision = market.order_size_increment
     min_token_amount = calc_min_token_amount(min_notional, current_price, precision)
 
     max_token_amount = resize_amount(
@@ -64,29 +64,17 @@ def calc_value_distribution(
     avg_token_amount_long = max_token_amount / Decimal(n_accounts_long)
     avg_token_amount_short = max_token_amount / Decimal(n_accounts_short)
 
-    noise_scale = Decimal(str(noise))
+    total_lots = int(max_token_amount / precision)
+    min_lots = int(min_token_amount / precision)
 
-    noise_long = np.random.normal(
-        loc=0.0,
-        scale=float(avg_token_amount_long * noise_scale),
-        size=n_accounts_long
-    )
-    distr_amount_long = [avg_token_amount_long + Decimal(str(n)) for n in noise_long]
-    distr_amount_long = [resize_amount(x, precision) for x in distr_amount_long]
-    distr_amount_long_corrected = correct_distribution(
-        distr_amount_long, max_token_amount, min_token_amount, precision
-    )
-
-    noise_short = np.random.normal(
-        loc=0.0,
-        scale=float(avg_token_amount_short * noise_scale),
-        size=n_accounts_short
-    )
-    distr_amount_short = [avg_token_amount_short + Decimal(str(n)) for n in noise_short]
-    distr_amount_short = [resize_amount(x, precision) for x in distr_amount_short]
-    distr_amount_short_corrected = correct_distribution(
-        distr_amount_short, max_token_amount, min_token_amount, precision
-    )
+    distr_amount_long_corrected = [
+        Decimal(lots) * precision
+        for lots in allocate_lots(noisy_weights(n_accounts_long, noise), total_lots, min_lots)
+    ]
+    distr_amount_short_corrected = [
+        Decimal(lots) * precision
+        for lots in allocate_lots(noisy_weights(n_accounts_short, noise), total_lots, min_lots)
+    ]
 
     logger.debug(
         f"\nToken: {token} | Nominal value: {nominal_value} USD | Price: {current_price}\n"
@@ -94,7 +82,7 @@ def calc_value_distribution(
         f"Max token amount: {max_token_amount} | Max accounts per order: {max_accounts_per_order}\n"
         f"Accounts long: {n_accounts_long}, short: {n_accounts_short}\n"
         f"Avg long amount: {avg_token_amount_long}, avg short amount: {avg_token_amount_short}\n"
-        f"Initial long sum: {sum(distr_amount_long):.8f}, Initial short sum: {sum(distr_amount_short):.8f}"
+        f"Total lots: {total_lots}, min lots per account: {min_lots}"
     )
 
     logger.debug(f"[LONG] Distribution: {[float(x) for x in distr_amount_long_corrected]}")
@@ -112,31 +100,36 @@ def calc_value_distribution(
     return distr_amount_long_corrected, distr_amount_short_corrected
 
 
-def correct_distribution(
-    distribution: list,
-    max_amount_allowed: Decimal,
-    min_amount_allowed: Decimal,
-    precision: Decimal
-) -> list:
-    for x in range(1_000_000):
-        random.shuffle(distribution)
-        for i in range(len(distribution)):
-            amount = distribution[i]
-            if amount < min_amount_allowed:
-                distribution[i] = min_amount_allowed
-            elif sum(distribution) > max_amount_allowed and amount > min_amount_allowed:
-                distribution[i] -= precision
-            elif sum(distribution) + precision <= max_amount_allowed:
-                distribution[i] += precision
-            distribution[i] = resize_amount(distribution[i], precision)
-
-        if sum(distribution) == max_amount_allowed:
-            logger.debug(f"Distribution corrected after {x} iterations")
-            return distribution
-
-    total = sum(distribution)
-    logger.error(f"Failed to correct distribution: total={total} vs expected={max_amount_allowed}")
-    raise ValueError("Cannot correct distribution: target sum not reached")
+def noisy_weights(n_accounts: int, noise: float) -> list:
+    return list(np.random.normal(loc=1.0, scale=noise, size=n_accounts))
+
+
+def allocate_lots(weights: list, total_lots: int, min_lots: int) -> list:
+    n = len(weights)
+    spare_lots = total_lots - n * min_lots
+
+    if n == 0 or spare_lots < 0:
+        logger.error(f"Cannot allocate {total_lots} lots across {n} accounts with min {min_lots} lots each")
+        raise ValueError("Cannot correct distribution: target sum not reached")
+
+    # Amounts are avg * weight; whatever exceeds the per-account minimum
+    # is scaled so the spare lots are shared in the same proportions.
+    avg_lots = total_lots / n
+    excess = [max(avg_lots * w - min_lots, 0.0) for w in weights]
+    excess_total = sum(excess)
+    if excess_total <= 0:
+        excess = [1.0] * n
+        excess_total = float(n)
+
+    shares = [e * spare_lots / excess_total for e in excess]
+    lots = [int(share) for share in shares]
+
+    remainder = spare_lots - sum(lots)
+    by_fraction = sorted(range(n), key=lambda i: shares[i] - lots[i], reverse=True)
+    for i in by_fraction[:remainder]:
+        lots[i] += 1
+
+    return [min_lots + x for x in lots]
 
 
 def calc_min_token_amount(
@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class Clock:
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(seconds, 0.0))
+
+    async def sleep_async(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0.0))
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(max(timeout, 0.0))
+
+
+class ScaledClock(Clock):
+    def __init__(self, speed: float) -> None:
+        if speed <= 0:
+            raise ValueError("Clock speed must be positive")
+        self.speed = speed
+        self._origin = time.time()
+
+    def time(self) -> float:
+        return self._origin + (time.time() - self._origin) * self.speed
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(seconds, 0.0) / self.speed)
+
+    async def sleep_async(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0.0) / self.speed)
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(max(timeout, 0.0) / self.speed)
+
+
+class SimulatedClock(Clock):
+    # Virtual time jumps to the earliest pending wake-up once every thread
+    # that uses the clock is asleep on it. A thread blocked elsewhere (a lock,
+    # a network call) holds time back for at most stall_sec of real time.
+    def __init__(self, start: Optional[float] = None, idle_sec: float = 0.001, stall_sec: float = 1.0) -> None:
+        self.idle_sec = idle_sec
+        self.stall_sec = stall_sec
+        self._now = time.time() if start is None else start
+        self._wakeups: List[float] = []
+        self._threads: Dict[int, threading.Thread] = {}
+        # Wake-up time of each participant thread that is asleep on the clock.
+        self._sleeping: Dict[int, float] = {}
+        # Pending sleep_async wake-ups per event loop thread.
+        self._async_waits: Dict[int, List[float]] = {}
+        self._cond = threading.Condition()
+
+    def time(self) -> float:
+        with self._cond:
+            return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self._wait_until(None, seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        # Virtual time only moves for threads asleep on the clock, so the
+        # event loop hands the wait to a pool thread. Pool threads are not
+        # participants: once idle they must not hold time back. The loop's
+        # own thread counts as asleep until its earliest pending wake-up.
+        ident = threading.get_ident()
+        with self._cond:
+            target = self._now + max(seconds, 0.0)
+            self._async_waits.setdefault(ident, []).append(target)
+        try:
+            await asyncio.to_thread(self._wait_for, None, target, False)
+        finally:
+            with self._cond:
+                waits = self._async_waits[ident]
+                waits.remove(target)
+                if not waits:
+                    del self._async_waits[ident]
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return self._wait_until(event, timeout)
+
+    def _all_asleep(self) -> bool:
+        for ident in [ident for ident, thread in self._threads.items() if not thread.is_alive()]:
+            del self._threads[ident]
+        return all(self._wake_at(ident) > self._now for ident in self._threads)
+
+    def _wake_at(self, ident: int) -> float:
+        if ident in self._sleeping:
+            return self._sleeping[ident]
+        waits = self._async_waits.get(ident)
+        return min(waits) if waits else self._now
+
+    def _wait_until(self, event: Optional[threading.Event], seconds: float, participant: bool = True) -> bool:
+        return self._wait_for(event, self.time() + max(seconds, 0.0), participant)
+
+    def _wait_for(self, event: Optional[threading.Event], target: float, participant: bool = True) -> bool:
+        with self._cond:
+            thread = threading.current_thread()
+            if participant:
+                self._threads[thread.ident] = thread
+                self._sleeping[thread.ident] = target
+            heapq.heappush(self._wakeups, target)
+            self._cond.notify_all()
+            stalled = 0.0
+            try:
+                while self._now < target:
+                    if event is not None and event.is_set():
+                        return True
+                    if self._cond.wait(self.idle_sec):
+                        stalled = 0.0
+                        continue
+                    stalled += self.idle_sec
+                    if self._all_asleep() or stalled >= self.stall_sec:
+                        self._now = max(self._now, min(w for w in self._wakeups if w > self._now))
+                        self._cond.notify_all()
+                        stalled = 0.0
+                return event is not None and event.is_set()
+            finally:
+                if participant:
+                    self._sleeping.pop(thread.ident, None)
+                self._wakeups.remove(target)
+                heapq.heapify(self._wakeups)
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    global _clock
+    _clock = clock
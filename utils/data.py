@@ -1,8 +1,13 @@
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
-from src.config.paths import CONFIG_PATH, STATE_PATH
+from src.config.paths import CONFIG_PATH, STATE_PATH, STATE_DB_PATH
+from utils.state_store import StateStore
+
+_state_store = None
+_state_store_lock = threading.Lock()
 
 
 def load_json(path: Path) -> Dict[str, Any]:
@@ -15,19 +20,29 @@ def dump_json(path: Path, json_file: dict) -> None:
         json.dump(json_file, file, ensure_ascii=False, indent=2)
 
 
+def get_state_store() -> StateStore:
+    global _state_store
+    if _state_store is None:
+        with _state_store_lock:
+            if _state_store is None:
+                _state_store = StateStore(STATE_DB_PATH, legacy_json_path=STATE_PATH)
+    return _state_store
+
+
 def update_state(private_key: str, key: Any, value: Any) -> None:
-    path = Path(STATE_PATH)
-    state = load_json(path)
+    get_state_store().update_state(private_key, key, value)
 
-    if private_key not in state:
-        state[private_key] = {}
 
-    state[private_key][str(key)] = value
-    dump_json(path, state)
+def update_many(private_key: str, values: Dict[Any, Any]) -> None:
+    get_state_store().update_many(private_key, values)
 
 
 def get_user_state() -> Dict[str, Any]:
-    return load_json(Path(STATE_PATH))
+    return get_state_store().get_user_state()
+
+
+def get_account_state(private_key: str) -> Dict[str, Any]:
+    return get_state_store().get_account_state(private_key)
 
 
 USER_CONFIG: Dict[str, Any] = load_json(Path(CONFIG_PATH))
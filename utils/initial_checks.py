@@ -2,8 +2,8 @@ import requests
 import pandas as pd
 
 from src.accounts_monitor import update_accounts_info
-from src.config.paths import DATA_DIR
 from src.config.constants import logger
+from utils.account_store import load_accounts
 from utils.data import USER_CONFIG
 from utils.proxy import convert_proxy_to_dict
 
@@ -65,6 +65,116 @@ def check_config() -> None:
     if config["retries"] < 0:
         raise ValueError("'retries' must be >= 0")
 
+    retry_policy = config.get("retry_policy")
+    if not isinstance(retry_policy, dict):
+        raise ValueError("Missing or invalid 'retry_policy'")
+
+    for key in ["base_delay_sec", "max_delay_sec", "breaker_reset_sec"]:
+        if not isinstance(retry_policy.get(key), (int, float)) or retry_policy[key] < 0:
+            raise ValueError(f"'retry_policy.{key}' must be a non-negative number")
+
+    if not isinstance(retry_policy.get("breaker_failure_threshold"), int) or retry_policy["breaker_failure_threshold"] < 1:
+        raise ValueError("'retry_policy.breaker_failure_threshold' must be an integer >= 1")
+
+    rate_limits = config.get("rate_limits")
+    if not isinstance(rate_limits, dict):
+        raise ValueError("Missing or invalid 'rate_limits'")
+
+    for endpoint, scopes in rate_limits.items():
+        for scope, limit in scopes.items():
+            for key in ["rate_per_sec", "burst"]:
+                if not isinstance(limit.get(key), (int, float)) or limit[key] <= 0:
+                    raise ValueError(f"'rate_limits.{endpoint}.{scope}.{key}' must be greater than 0")
+
+    refresh = config.get("accounts_refresh")
+    if not isinstance(refresh, dict):
+        raise ValueError("Missing or invalid 'accounts_refresh'")
+
+    for key in ["concurrency", "per_proxy_concurrency"]:
+        if not isinstance(refresh.get(key), int) or refresh[key] < 1:
+            raise ValueError(f"'accounts_refresh.{key}' must be an integer >= 1")
+
+    if not isinstance(refresh.get("background_interval_sec"), (int, float)) or refresh["background_interval_sec"] <= 0:
+        raise ValueError("'accounts_refresh.background_interval_sec' must be greater than 0")
+
+    if not isinstance(refresh.get("background_batch_size"), int) or refresh["background_batch_size"] < 1:
+        raise ValueError("'accounts_refresh.background_batch_size' must be an integer >= 1")
+
+    jitter = refresh.get("jitter_sec")
+    if jitter is not None:
+        if not isinstance(jitter, dict) or "min" not in jitter or "max" not in jitter:
+            raise ValueError("'accounts_refresh.jitter_sec' must contain both 'min' and 'max' keys")
+        if jitter["min"] < 0 or jitter["min"] > jitter["max"]:
+            raise ValueError("In 'accounts_refresh.jitter_sec', 'min' must be >= 0 and <= 'max'")
+
+    planner = config.get("planner")
+    if not isinstance(planner, dict):
+        raise ValueError("Missing or invalid 'planner'")
+
+    if not isinstance(planner.get("lead_min"), (int, float)) or planner["lead_min"] < 0:
+        raise ValueError("'planner.lead_min' must be a non-negative number")
+
+    sessions = config.get("sessions")
+    if not isinstance(sessions, dict):
+        raise ValueError("Missing or invalid 'sessions'")
+
+    if not isinstance(sessions.get("count"), int) or sessions["count"] < 1:
+        raise ValueError("'sessions.count' must be an integer >= 1")
+
+    if not isinstance(sessions.get("max_total_notional_usd"), (int, float)) or sessions["max_total_notional_usd"] <= 0:
+        raise ValueError("'sessions.max_total_notional_usd' must be a positive number")
+
+    signing = config.get("signing")
+    if not isinstance(signing, dict):
+        raise ValueError("Missing or invalid 'signing'")
+
+    if not isinstance(signing.get("processes"), int) or signing["processes"] < 0:
+        raise ValueError("'signing.processes' must be an integer >= 0")
+
+    workers = config.get("workers")
+    if not isinstance(workers, dict):
+        raise ValueError("Missing or invalid 'workers'")
+
+    if not isinstance(workers.get("processes"), int) or workers["processes"] < 0:
+        raise ValueError("'workers.processes' must be an integer >= 0")
+
+    if not isinstance(workers.get("threads"), int) or workers["threads"] < 1:
+        raise ValueError("'workers.threads' must be an integer >= 1")
+
+    execution = config.get("execution")
+    if not isinstance(execution, dict):
+        raise ValueError("Missing or invalid 'execution'")
+
+    if execution.get("mode") not in ["sequential", "concurrent", "paired"]:
+        raise ValueError("'execution.mode' must be one of 'sequential', 'concurrent', 'paired'")
+
+    if not isinstance(execution.get("max_skew_ms"), (int, float)) or execution["max_skew_ms"] < 0:
+        raise ValueError("'execution.max_skew_ms' must be a non-negative number")
+
+    emergency = config.get("emergency_close")
+    if not isinstance(emergency, dict):
+        raise ValueError("Missing or invalid 'emergency_close'")
+
+    for key in ["retries", "sweep_rounds", "max_workers"]:
+        if not isinstance(emergency.get(key), int) or emergency[key] < 1:
+            raise ValueError(f"'emergency_close.{key}' must be an integer >= 1")
+
+    if not isinstance(emergency.get("retry_delay_sec"), (int, float)) or emergency["retry_delay_sec"] < 0:
+        raise ValueError("'emergency_close.retry_delay_sec' must be a non-negative number")
+
+    market_data = config.get("market_data")
+    if not isinstance(market_data, dict):
+        raise ValueError("Missing or invalid 'market_data'")
+
+    if market_data.get("source") not in ["ws", "rest"]:
+        raise ValueError("'market_data.source' must be either 'ws' or 'rest'")
+
+    if market_data["source"] == "ws":
+        if not str(market_data.get("ws_url", "")).startswith(("ws://", "wss://")):
+            raise ValueError("'market_data.ws_url' must be a ws:// or wss:// URL")
+        if not isinstance(market_data.get("stale_after_sec"), (int, float)) or market_data["stale_after_sec"] <= 0:
+            raise ValueError("'market_data.stale_after_sec' must be greater than 0")
+
     if "debug_level" not in config or not isinstance(config["debug_level"], str):
         raise ValueError("Missing or invalid 'debug_level'")
 
@@ -76,12 +186,12 @@ def check_config() -> None:
 
 
 def check_accounts() -> None:
-    df = pd.read_excel(DATA_DIR + "/accounts.xlsx")
+    df = load_accounts()
 
     required_columns = ["USDC", "is_active", "position_market", "proxy"]
     for col in required_columns:
         if col not in df.columns:
-            raise ValueError(f"Missing '{col}' column in accounts.xlsx")
+            raise ValueError(f"Missing '{col}' column in account store")
 
     if not df["is_active"].dropna().apply(lambda x: isinstance(x, bool)).all():
         raise ValueError("Column 'is_active' must contain only boolean values (True/False)")
@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.constants import logger
+from src.paradex.market import get_market_by_symbol
+from utils.margin import market_liquidation_prices
+
+
+def trigger_price(side: str, liq_price: float, max_ltv: float) -> float:
+    if side == "SELL":
+        return liq_price * max_ltv / 100
+    if side == "BUY":
+        return liq_price * 100 / max_ltv
+    raise ValueError(f"Unknown order side: {side}")
+
+
+def calc_ltv(side: str, liq_price: float, price: float) -> float:
+    if side == "SELL":
+        return price / liq_price * 100
+    return liq_price / price * 100
+
+
+class MarketTriggers:
+    __slots__ = ("pks", "sides", "liq_prices", "triggers", "is_short", "upper", "lower")
+
+    def __init__(self, entries: List[Tuple[str, str, float, float]]) -> None:
+        self.pks = [pk for pk, _, _, _ in entries]
+        self.sides = [side for _, side, _, _ in entries]
+        self.liq_prices = np.array([liq for _, _, liq, _ in entries], dtype=np.float64)
+        self.triggers = np.array([trigger for _, _, _, trigger in entries], dtype=np.float64)
+        self.is_short = np.array([side == "SELL" for side in self.sides], dtype=bool)
+
+        # Shorts breach when the price rises to their trigger, longs when it
+        # falls to it, so one bound per direction decides the common case.
+        self.upper = self.triggers[self.is_short].min() if self.is_short.any() else np.inf
+        self.lower = self.triggers[~self.is_short].max() if (~self.is_short).any() else -np.inf
+
+    def breached(self, price: float) -> np.ndarray:
+        if self.lower < price < self.upper:
+            return np.empty(0, dtype=np.int64)
+        mask = np.where(self.is_short, price >= self.triggers, price <= self.triggers)
+        return np.flatnonzero(mask)
+
+
+class TriggerBook:
+    def __init__(self, max_ltv: float) -> None:
+        self.max_ltv = max_ltv
+        self._markets: Dict[str, MarketTriggers] = {}
+
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict[str, Dict[str, Any]],
+        max_ltv: float,
+        balances: Optional[Dict[str, float]] = None,
+        exchange_liq_prices: Optional[Dict[str, float]] = None,
+    ) -> "TriggerBook":
+        grouped: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+
+        for pk, info in state.items():
+            if info.get("position") != "active":
+                continue
+
+            side = info.get("order_side", "").upper()
+            market = info.get("last_order", {}).get("market", "")
+            if not market or "-" not in market or side not in ("BUY", "SELL"):
+                continue
+
+            grouped.setdefault(market, []).append((pk, side, info))
+
+        book = cls(max_ltv)
+        for market, rows in grouped.items():
+            entries = []
+            liq_prices, known = _liquidation_prices(market, rows, balances or {}, exchange_liq_prices or {})
+            for (pk, side, info), liq_price, is_known in zip(rows, liq_prices, known):
+                if liq_price > 0:
+                    entries.append((pk, side, liq_price, trigger_price(side, liq_price, max_ltv)))
+                elif not is_known:
+                    logger.error(f"[{pk[:10]}] No balance or liquidation price for {market}: LTV is NOT monitored!")
+            if entries:
+                book._markets[market] = MarketTriggers(entries)
+        return book
+
+    def markets(self) -> List[str]:
+        return list(self._markets)
+
+    def check(self, market: str, price: float) -> List[Tuple[str, str, float, float]]:
+        triggers = self._markets.get(market)
+        if triggers is None or price <= 0:
+            return []
+
+        return [
+            (triggers.pks[i], triggers.sides[i], float(triggers.liq_prices[i]),
+             calc_ltv(triggers.sides[i], float(triggers.liq_prices[i]), price))
+            for i in triggers.breached(price)
+        ]
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _liquidation_prices(
+    market: str,
+    rows: List[Tuple[str, str, Dict[str, Any]]],
+    current_balances: Dict[str, float],
+    exchange_liq_prices: Dict[str, float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    # The exchange's figure when we have one, else the one recorded at entry.
+    stored = np.array([
+        exchange_liq_prices.get(pk) or _float(info.get("order_liq_price")) for pk, _, info in rows
+    ], dtype=np.float64)
+    # Latest refreshed balance, so funding and realized PnL move the price.
+    balances = np.array([
+        current_balances.get(pk) or _float(info.get("order_balance")) for pk, _, info in rows
+    ], dtype=np.float64)
+    sizes = np.array([
+        _float(info.get("order_size")) * (-1 if side == "SELL" else 1) for _, side, info in rows
+    ], dtype=np.float64)
+    entry_prices = np.array([_float(info.get("order_entry_price")) for _, _, info in rows], dtype=np.float64)
+
+    # A known balance with no liquidation price means the position can't be
+    # liquidated; no balance and no price at all means we are flying blind.
+    known = (balances > 0) | (stored > 0)
+    try:
+        local = market_liquidation_prices(get_market_by_symbol(market), balances, sizes, entry_prices)
+    except (ValueError, RuntimeError):
+        return stored, known
+
+    return np.where((balances > 0) & (local > 0), local, stored), known
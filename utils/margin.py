@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.paradex.models import Market
+
+
+def initial_margin_fraction(market: Market, notional: np.ndarray) -> np.ndarray:
+    notional = np.abs(np.asarray(notional, dtype=np.float64))
+    scaled = float(market.imf_factor) * np.sqrt(np.maximum(notional - float(market.imf_shift), 0.0))
+    return np.maximum(float(market.imf_base), scaled)
+
+
+def maintenance_margin_fraction(market: Market, notional: np.ndarray) -> np.ndarray:
+    return initial_margin_fraction(market, notional) * float(market.mmf_factor)
+
+
+def liquidation_prices(
+    balances: np.ndarray,
+    sizes: np.ndarray,
+    entry_prices: np.ndarray,
+    mmf: np.ndarray,
+) -> np.ndarray:
+    # Sizes are signed (long > 0). Liquidation is where the account value
+    # B + s * (P - E) drops to the maintenance requirement |s| * P * mmf.
+    balances = np.asarray(balances, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+    entry_prices = np.asarray(entry_prices, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prices = (sizes * entry_prices - balances) / (sizes * (1 - np.sign(sizes) * mmf))
+
+    return np.where((sizes != 0) & np.isfinite(prices) & (prices > 0), prices, 0.0)
+
+
+def market_liquidation_prices(
+    market: Market,
+    balances: np.ndarray,
+    sizes: np.ndarray,
+    entry_prices: np.ndarray,
+) -> np.ndarray:
+    sizes = np.asarray(sizes, dtype=np.float64)
+    entry_prices = np.asarray(entry_prices, dtype=np.float64)
+    mmf = maintenance_margin_fraction(market, sizes * entry_prices)
+    return liquidation_prices(balances, sizes, entry_prices, mmf)
@@ -0,0 +1,31 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+from src.config.constants import logger
+
+_counters: Dict[str, float] = defaultdict(float)
+_lock = threading.Lock()
+
+
+def incr(name: str, value: float = 1) -> None:
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name: str, value: float) -> None:
+    with _lock:
+        _counters[f"{name}.count"] += 1
+        _counters[f"{name}.sum"] += value
+        _counters[f"{name}.max"] = max(_counters[f"{name}.max"], value)
+
+
+def snapshot() -> Dict[str, float]:
+    with _lock:
+        return dict(_counters)
+
+
+def log_metrics() -> None:
+    metrics = snapshot()
+    if metrics:
+        logger.debug("Metrics: " + ", ".join(f"{name}={round(value, 3)}" for name, value in sorted(metrics.items())))
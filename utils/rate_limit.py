@@ -0,0 +1,77 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from utils import metrics
+from utils.clock import get_clock
+
+
+class TokenBucket:
+    def __init__(self, rate_per_sec: float, burst: float) -> None:
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = get_clock().time()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            # Refill on the clock that acquire() sleeps on, or simulated and
+            # scaled waits would never see the bucket refill.
+            now = get_clock().time()
+            self._tokens = min(self.burst, self._tokens + max(now - self._updated_at, 0.0) * self.rate_per_sec)
+            self._updated_at = now
+
+            # Tokens may go negative: each caller books its own slot and
+            # waits for it, which keeps waiters in FIFO order.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+
+class RateLimiter:
+    def __init__(self, limits: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+        self.limits = limits
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, endpoint_class: str, scope: str, key: str) -> Optional[TokenBucket]:
+        settings = self.limits.get(endpoint_class, {}).get(scope)
+        if not settings:
+            return None
+
+        bucket_key = (endpoint_class, scope, key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    bucket_key, TokenBucket(settings["rate_per_sec"], settings["burst"])
+                )
+        return bucket
+
+    def reserve(self, endpoint_class: str, proxy_key: str, account_key: Optional[str] = None) -> float:
+        buckets: List[Optional[TokenBucket]] = [self._bucket(endpoint_class, "per_proxy", proxy_key)]
+        if account_key:
+            buckets.append(self._bucket(endpoint_class, "per_account", account_key))
+
+        wait = max([bucket.reserve() for bucket in buckets if bucket is not None], default=0.0)
+        metrics.observe(f"rate_limit.{endpoint_class}.wait_sec", wait)
+        return wait
+
+    def acquire(self, endpoint_class: str, proxy_key: str, account_key: Optional[str] = None) -> float:
+        wait = self.reserve(endpoint_class, proxy_key, account_key)
+        if wait > 0:
+            get_clock().sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint_class: str, proxy_key: str, account_key: Optional[str] = None) -> float:
+        wait = self.reserve(endpoint_class, proxy_key, account_key)
+        if wait > 0:
+            await get_clock().sleep_async(wait)
+        return wait
+
+
+def endpoint_class(method: str, path: str) -> str:
+    if method.upper() != "GET" and "/orders" in path:
+        return "orders"
+    return "reads"
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from src.config.constants import logger
+from utils.clock import get_clock
+from utils.data import USER_CONFIG
+from utils import metrics
+
+
+class ParadexAPIError(ValueError):
+    def __init__(self, message: str, status_code: int, text: str = "", retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.text = text
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_response(cls, message: str, status_code: int, text: str, headers) -> "ParadexAPIError":
+        retry_after = None
+        try:
+            retry_after = float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+        return cls(message, status_code, text, retry_after)
+
+    def __reduce__(self):
+        return type(self), (str(self), self.status_code, self.text, self.retry_after)
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {key}, retry in {round(retry_in, 1)} sec")
+        self.key = key
+        self.retry_in = retry_in
+
+    def __reduce__(self):
+        return type(self), (self.key, self.retry_in)
+
+
+class OrderSubmittedError(RuntimeError):
+    # The exchange accepted the order, so it may be live: never re-send it,
+    # reconcile by id instead.
+    def __init__(self, order_id: str, message: str) -> None:
+        super().__init__(message)
+        self.order_id = order_id
+
+    def __reduce__(self):
+        return type(self), (self.order_id, str(self))
+
+
+class OrderRejectedError(ValueError):
+    pass
+
+
+class RemoteError(RuntimeError):
+    # An error raised in a shard worker, carried back with its classification
+    # so retries treat it like the original.
+    def __init__(self, kind: str, message: str) -> None:
+        super().__init__(message)
+        self.kind = kind
+
+    def __reduce__(self):
+        return type(self), (self.kind, str(self))
+
+
+class CircuitBreaker:
+    def __init__(self, key: str, failure_threshold: int, reset_sec: float) -> None:
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_sec = reset_sec
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            retry_in = self._opened_at + self.reset_sec - get_clock().time()
+            if retry_in > 0:
+                raise CircuitOpenError(self.key, retry_in)
+            # Half-open: let this call through, a failure re-opens the circuit.
+            self._opened_at = None
+            self._failures = self.failure_threshold - 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold and self._opened_at is None:
+                self._opened_at = get_clock().time()
+                metrics.incr("circuit.opened")
+                logger.warning(f"Circuit opened for {self.key} after {self._failures} failures")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(key: str) -> CircuitBreaker:
+    breaker = _breakers.get(key)
+    if breaker is None:
+        settings = USER_CONFIG["retry_policy"]
+        with _breakers_lock:
+            breaker = _breakers.setdefault(
+                key,
+                CircuitBreaker(key, settings["breaker_failure_threshold"], settings["breaker_reset_sec"]),
+            )
+    return breaker
+
+
+# Order errors that prove nothing reached the matching engine. Anything else
+# on POST /orders may have been accepted and must be reconciled first.
+ORDER_RETRY_KINDS = ("connect", "rate_limit", "circuit_open", "rejected")
+
+
+def _not_connected(exc: BaseException) -> bool:
+    if isinstance(exc, (requests.ConnectTimeout, requests.exceptions.ProxyError, requests.exceptions.SSLError)):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def classify_error(exc: BaseException) -> str:
+    if isinstance(exc, RemoteError):
+        return exc.kind
+    if isinstance(exc, OrderSubmittedError):
+        return "submitted"
+    if isinstance(exc, OrderRejectedError):
+        return "rejected"
+    if isinstance(exc, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(exc, ParadexAPIError):
+        if exc.status_code == 429:
+            return "rate_limit"
+        if exc.status_code >= 500:
+            return "server"
+        if 400 <= exc.status_code < 500:
+            return "client"
+    if isinstance(exc, requests.ConnectionError) and _not_connected(exc):
+        return "connect"
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError, asyncio.TimeoutError, TimeoutError)):
+        return "timeout"
+    return "other"
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        retries: int,
+        base_delay_sec: float,
+        max_delay_sec: float,
+        retry_kinds: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        self.retries = retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        # None retries every kind except client errors.
+        self.retry_kinds = retry_kinds
+
+    @classmethod
+    def from_config(cls, retries: Optional[int] = None) -> "RetryPolicy":
+        settings = USER_CONFIG["retry_policy"]
+        return cls(
+            retries=USER_CONFIG["retries"] if retries is None else retries,
+            base_delay_sec=settings["base_delay_sec"],
+            max_delay_sec=settings["max_delay_sec"],
+        )
+
+    @classmethod
+    def for_orders(cls, retries: Optional[int] = None) -> "RetryPolicy":
+        policy = cls.from_config(retries)
+        policy.retry_kinds = ORDER_RETRY_KINDS
+        return policy
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.base_delay_sec * 2 ** (attempt - 1), self.max_delay_sec)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def next_delay(self, exc: BaseException, attempt: int) -> Optional[float]:
+        kind = classify_error(exc)
+        metrics.incr(f"retry.{kind}")
+
+        if kind in ("client", "submitted") or attempt >= self.retries:
+            return None
+        if self.retry_kinds is not None and kind not in self.retry_kinds:
+            return None
+        if kind == "rate_limit" and exc.retry_after is not None:
+            return min(exc.retry_after, self.max_delay_sec)
+        if kind == "circuit_open":
+            return min(exc.retry_in, self.max_delay_sec)
+        return self.backoff(attempt)
+
+    def call(self, func, *args, breaker_key: Optional[str] = None, **kwargs):
+        breaker = get_breaker(breaker_key) if breaker_key else None
+        name = getattr(func, "__name__", str(func))
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                if breaker is not None:
+                    breaker.before_call()
+                result = func(*args, **kwargs)
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._on_failure(e, attempt, name, breaker)
+                if delay is None:
+                    if isinstance(e, OrderSubmittedError):
+                        raise
+                    raise RuntimeError(f"All {attempt} attempts failed for {name}") from e
+                get_clock().sleep(delay)
+
+        raise RuntimeError(f"No attempts made for {name}")
+
+    async def call_async(self, func, *args, breaker_key: Optional[str] = None, **kwargs):
+        breaker = get_breaker(breaker_key) if breaker_key else None
+        name = getattr(func, "__name__", str(func))
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                if breaker is not None:
+                    breaker.before_call()
+                result = await func(*args, **kwargs)
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+            except Exception as e:
+                delay = self._on_failure(e, attempt, name, breaker)
+                if delay is None:
+                    raise RuntimeError(f"All {attempt} attempts failed for {name}") from e
+                await get_clock().sleep_async(delay)
+
+        raise RuntimeError(f"No attempts made for {name}")
+
+    def _on_failure(
+        self, exc: Exception, attempt: int, name: str, breaker: Optional[CircuitBreaker]
+    ) -> Optional[float]:
+        kind = classify_error(exc)
+        if breaker is not None and kind in ("rate_limit", "server", "timeout", "connect"):
+            breaker.record_failure()
+
+        logger.warning(f"Attempt {attempt}/{self.retries} failed for {name} ({kind}): {exc}")
+        delay = self.next_delay(exc, attempt)
+        if delay is None:
+            metrics.incr("retry.exhausted")
+        return delay
@@ -0,0 +1,119 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+
+from starknet_py.hash.utils import message_signature
+from starknet_py.net.account.account import Account
+from starknet_py.utils.typed_data import TypedData
+
+from utils.data import USER_CONFIG
+from utils.stark import build_auth_message, build_trade_message
+
+Signature = Tuple[int, int]
+
+
+def _sign(msg_hash: int, private_key: int) -> Signature:
+    r, s = message_signature(msg_hash=msg_hash, priv_key=private_key)
+    return r, s
+
+
+class SigningEngine:
+    def __init__(self, processes: int = 0) -> None:
+        self.processes = processes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    @staticmethod
+    def order_hash(
+        account_address: int,
+        market: str,
+        order_type: str,
+        order_side: str,
+        size: Decimal,
+        timestamp: int,
+    ) -> int:
+        message = build_trade_message(market, order_type, order_side, size, timestamp)
+        return TypedData.from_dict(message).message_hash(account_address)
+
+    @staticmethod
+    def auth_hash(
+        account_address: int,
+        method: str,
+        path: str,
+        body: str,
+        timestamp: int,
+        expiration: int,
+    ) -> int:
+        message = build_auth_message(method, path, body, timestamp, expiration)
+        return TypedData.from_dict(message).message_hash(account_address)
+
+    def sign_hash(self, private_key: int, msg_hash: int) -> Signature:
+        if self.processes <= 0:
+            return _sign(msg_hash, private_key)
+        return self._executor().submit(_sign, msg_hash, private_key).result()
+
+    def sign_many(self, items: Iterable[Tuple[int, int]]) -> List[Signature]:
+        items = list(items)
+        if self.processes <= 0:
+            return [_sign(msg_hash, private_key) for private_key, msg_hash in items]
+        hashes = [msg_hash for _, msg_hash in items]
+        keys = [private_key for private_key, _ in items]
+        chunksize = max(len(items) // (self.processes * 4), 1)
+        return list(self._executor().map(_sign, hashes, keys, chunksize=chunksize))
+
+    def sign_order(
+        self,
+        account: Account,
+        market: str,
+        order_type: str,
+        order_side: str,
+        size: Decimal,
+        timestamp: int,
+    ) -> Signature:
+        msg_hash = self.order_hash(account.address, market, order_type, order_side, size, timestamp)
+        return self.sign_hash(account.signer.private_key, msg_hash)
+
+    def sign_auth(
+        self,
+        account: Account,
+        method: str,
+        path: str,
+        body: str,
+        timestamp: int,
+        expiration: int,
+    ) -> Signature:
+        msg_hash = self.auth_hash(account.address, method, path, body, timestamp, expiration)
+        return self.sign_hash(account.signer.private_key, msg_hash)
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # Forking a process that already runs HTTP and refresher
+                    # threads can copy held locks into the child.
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                    )
+                    atexit.register(self.shutdown)
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_engine: Optional[SigningEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_signing_engine() -> SigningEngine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SigningEngine(processes=USER_CONFIG.get("signing", {}).get("processes", 0))
+    return _engine
@@ -0,0 +1,92 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+
+class StateStore:
+    def __init__(self, db_path: str, legacy_json_path: Optional[str] = None) -> None:
+        self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
+        self._local = threading.local()
+        self._init_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            "private_key TEXT NOT NULL, "
+            "key TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "PRIMARY KEY (private_key, key))"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._migrate_legacy_json()
+
+    def _migrate_legacy_json(self) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            migrated = conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone()
+            if not migrated:
+                legacy = {}
+                if self.legacy_json_path and os.path.exists(self.legacy_json_path):
+                    with open(self.legacy_json_path, encoding="utf-8") as file:
+                        content = file.read().strip()
+                    legacy = json.loads(content) if content else {}
+
+                rows = [
+                    (private_key, str(key), json.dumps(value))
+                    for private_key, values in legacy.items()
+                    for key, value in values.items()
+                ]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO state (private_key, key, value) VALUES (?, ?, ?)", rows
+                )
+                conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(len(rows)),))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_user_state(self) -> Dict[str, Dict[str, Any]]:
+        state: Dict[str, Dict[str, Any]] = {}
+        for private_key, key, value in self._connection().execute(
+            "SELECT private_key, key, value FROM state"
+        ):
+            state.setdefault(private_key, {})[key] = json.loads(value)
+        return state
+
+    def get_account_state(self, private_key: str) -> Dict[str, Any]:
+        rows = self._connection().execute(
+            "SELECT key, value FROM state WHERE private_key = ?", (private_key,)
+        )
+        return {key: json.loads(value) for key, value in rows}
+
+    def update_state(self, private_key: str, key: Any, value: Any) -> None:
+        self.update_many(private_key, {key: value})
+
+    def update_many(self, private_key: str, values: Dict[Any, Any]) -> None:
+        rows = [(private_key, str(key), json.dumps(value)) for key, value in values.items()]
+
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO state (private_key, key, value) VALUES (?, ?, ?)", rows
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise